@@ -410,7 +410,7 @@ class ActiveApplication(QObject):
             self._state = FilterState.OPENED
             MethodInvoker(self.close, Qt.QueuedConnection)
             MethodInvoker(self.deinit, Qt.QueuedConnection)
-            logger.error(str(e))
+            logger.error("%s", e)
             return
         for itc in self._interThreadConns:
             # set connections in active mode.
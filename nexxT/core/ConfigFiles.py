@@ -22,6 +22,8 @@ class ConfigFileLoader:
     """
     _validator = None
     _validatorGuiState = None
+    # absolute file name -> (file signature, validated contents), see _loadValidated
+    _validatedContents = {}
 
     @staticmethod
     def load(config, file):
@@ -35,17 +37,13 @@ class ConfigFileLoader:
         validator, validatorGuiState = ConfigFileLoader._getValidator()
         if not isinstance(file, Path):
             file = Path(file)
-        with file.open("r", encoding='utf-8') as fp:
-            cfg = json.load(fp)
-        validator.validate(cfg)
+        cfg = ConfigFileLoader._loadValidated(file, validator)
         guistateFile = file.parent / (file.name + ".guistate")
         if guistateFile.exists():
             try:
-                with guistateFile.open("r", encoding="utf-8") as fp:
-                    guistate = json.load(fp)
-                    logger.internal("loaded gui state from %s -> %s", guistateFile,
-                                    json.dumps(guistate, indent=2, ensure_ascii=False))
-                validatorGuiState.validate(guistate)
+                guistate = ConfigFileLoader._loadValidated(guistateFile, validatorGuiState)
+                logger.internal("loaded gui state from %s -> %s", guistateFile,
+                                json.dumps(guistate, indent=2, ensure_ascii=False))
             except Exception as e: # pylint: disable=broad-except
                 # catching a broad exception is exactly wanted here.
                 logger.warning("ignoring error while loading %s: %s", guistateFile, e)
@@ -80,9 +78,7 @@ class ConfigFileLoader:
         oldCfg = None
         if file.exists():
             try:
-                with file.open("r", encoding="utf-8") as fp:
-                    oldCfg = json.load(fp)
-                    validator.validate(oldCfg)
+                oldCfg = ConfigFileLoader._loadValidated(file, validator)
             except Exception: # pylint: disable=broad-except
                 # catching a broad exception is exactly wanted here
                 oldCfg = None
@@ -103,8 +99,10 @@ class ConfigFileLoader:
 
         with file.open("w", encoding='utf-8') as fp:
             json.dump(cfg, fp, indent=2, ensure_ascii=False)
+        ConfigFileLoader._invalidate(file)
         if guistate is not None:
             guistateFile = file.parent / (file.name + ".guistate")
+            ConfigFileLoader._invalidate(guistateFile)
             with guistateFile.open("w", encoding="utf-8") as fp:
                 json.dump(guistate, fp, indent=2, ensure_ascii=False)
                 logger.internal("saved gui state to %s -> %s", guistateFile,
@@ -128,9 +126,7 @@ class ConfigFileLoader:
         # first, read original cfg file contents
         if file.exists():
             try:
-                with file.open("r", encoding="utf-8") as fp:
-                    oldCfg = json.load(fp)
-                    validator.validate(oldCfg)
+                oldCfg = ConfigFileLoader._loadValidated(file, validator)
             except Exception: # pylint: disable=broad-except
                 # catching a general exception is exactly wanted here
                 oldCfg = None
@@ -139,6 +135,7 @@ class ConfigFileLoader:
         _, guistate = ConfigFileLoader._split(cfg, oldCfg)
         validatorGuiState.validate(guistate)
         guistateFile = file.parent / (file.name + ".guistate")
+        ConfigFileLoader._invalidate(guistateFile)
         with guistateFile.open("w", encoding="utf-8") as fp:
             json.dump(guistate, fp, indent=2, ensure_ascii=False)
             logger.internal("saving gui state to %s -> %s", guistateFile,
@@ -162,6 +159,41 @@ class ConfigFileLoader:
             validatorClass, {"properties": setDefaults},
         )
 
+    @staticmethod
+    def _loadValidated(file, validator):
+        """
+        Loads a json file and validates it (this also applies the default values of the schema). Parsing and
+        validation are expensive for large configurations, so the validated contents are cached as long as the raw
+        file contents are unchanged. The file contents are compared instead of the modification time, because the
+        file might be rewritten by another program within the timestamp granularity of the file system.
+
+        :param file: a Path instance
+        :param validator: the validator instance for this kind of file
+        :return: a new dictionary with the file contents
+        """
+        key = str(file.absolute())
+        raw = file.read_bytes()
+        signature = (raw, id(validator))
+        cached = ConfigFileLoader._validatedContents.get(key)
+        if cached is None or cached[0] != signature:
+            contents = json.loads(raw.decode("utf-8"))
+            validator.validate(contents)
+            cached = (signature, contents)
+            ConfigFileLoader._validatedContents[key] = cached
+        # the callers modify the returned dictionary
+        return copy.deepcopy(cached[1])
+
+    @staticmethod
+    def _invalidate(file):
+        """
+        Removes a file from the cache of validated contents. This is done when the file is written, the cached
+        contents are outdated anyway.
+
+        :param file: a Path instance
+        :return: None
+        """
+        ConfigFileLoader._validatedContents.pop(str(file.absolute()), None)
+
     @staticmethod
     def _getValidator():
         if ConfigFileLoader._validator is None:
@@ -31,6 +31,8 @@ class Configuration(QObject):
     appActivated = Signal(str, object)
     configLoaded = Signal()
     configAboutToSave = Signal()
+    configAboutToClose = Signal()
+    configClosed = Signal()
     dirtyChanged = Signal(bool)
 
     CONFIG_TYPE_COMPOSITE = 0
@@ -104,17 +106,23 @@ class Configuration(QObject):
         Application.unactivate()
         for sc in self._compositeFilters + self._applications:
             sc.cleanup()
-        for c in self._compositeFilters:
-            self.subConfigRemoved.emit(c.getName(), self.CONFIG_TYPE_COMPOSITE)
-        self._compositeFilters = []
-        for a in self._applications:
-            self.subConfigRemoved.emit(a.getName(), self.CONFIG_TYPE_APPLICATION)
-        self._applications = []
-        self._propertyCollection.deleteLater()
-        self._propertyCollection = self._defaultRootPropColl()
-        self.configNameChanged.emit(None)
-        self.appActivated.emit("", None)
-        PluginManager.singleton().unloadAll()
+        # closing is bracketed by configAboutToClose and configClosed, so that listeners can handle the removal of all
+        # subconfigs as a single update; configClosed is also emitted on errors so that listeners don't get stuck
+        self.configAboutToClose.emit()
+        try:
+            for c in self._compositeFilters:
+                self.subConfigRemoved.emit(c.getName(), self.CONFIG_TYPE_COMPOSITE)
+            self._compositeFilters = []
+            for a in self._applications:
+                self.subConfigRemoved.emit(a.getName(), self.CONFIG_TYPE_APPLICATION)
+            self._applications = []
+            self._propertyCollection.deleteLater()
+            self._propertyCollection = self._defaultRootPropColl()
+            self.configNameChanged.emit(None)
+            self.appActivated.emit("", None)
+            PluginManager.singleton().unloadAll()
+        finally:
+            self.configClosed.emit()
         logger.internal("leaving Configuration.close")
 
     @Slot(object)
@@ -9,7 +9,9 @@ This module contains implementations for abstract classes InputPort and OutputPo
 """
 
 import logging
-from nexxT.Qt.QtCore import QThread, QSemaphore, Signal, QObject, Qt
+import weakref
+from collections import deque
+from nexxT.Qt.QtCore import QThread, QSemaphore, Signal, QObject, Qt, QMutex, QMutexLocker
 from nexxT.interface.Ports import InputPortInterface, OutputPortInterface
 from nexxT.interface.DataSamples import DataSample
 from nexxT.interface.Services import Services
@@ -22,13 +24,16 @@ class InterThreadConnection(QObject):
     """
     Helper class for transmitting data samples between threads
     """
-    transmitInterThread = Signal(object, QSemaphore)
+    samplesPending = Signal(object)
 
     def __init__(self, qthreadFrom, width):
         super().__init__()
         self.moveToThread(qthreadFrom)
         self.semaphore = QSemaphore(width) if width > 0 else None
         self._stopped = True
+        # samples which have been acquired by the source thread but not yet taken by the receiving thread
+        self._pendingMutex = QMutex()
+        self._pending = []
 
     def receiveSample(self, dataSample):
         """
@@ -46,9 +51,62 @@ class InterThreadConnection(QObject):
                 logger.info("The inter-thread connection is set to stopped mode; data sample discarded.")
                 break
             if self.semaphore is None or self.semaphore.tryAcquire(1, 500):
-                self.transmitInterThread.emit(dataSample, self.semaphore)
+                self._addPending([dataSample])
                 break
 
+    def takePendingSamples(self):
+        """
+        Return the samples which are waiting for the receiving thread and clear the pending queue. Note: This method
+        is thread safe and may be called from any thread.
+        :return: a list of DataSample instances
+        """
+        with QMutexLocker(self._pendingMutex):
+            res = self._pending
+            self._pending = []
+        return res
+
+    def receiveSampleBatch(self, dataSamples):
+        """
+        Receive a list of samples, called in the source's thread. The semaphore is acquired once per sample, the
+        samples are forwarded with as few inter-thread events as possible.
+        :param dataSamples: the list of samples to be received
+        :return: None
+        """
+        self._receiveSampleBatch(dataSamples)
+
+    @handleException
+    def _receiveSampleBatch(self, dataSamples):
+        assert QThread.currentThread() is self.thread()
+        pending = []
+        for dataSample in dataSamples:
+            while True:
+                if self._stopped:
+                    logger.info("The inter-thread connection is set to stopped mode; data samples discarded.")
+                    if self.semaphore is not None and len(pending) > 0:
+                        self.semaphore.release(len(pending))
+                    return
+                if self.semaphore is None or self.semaphore.tryAcquire(1):
+                    pending.append(dataSample)
+                    break
+                # the receiver needs to release the semaphore, so forward the samples acquired so far
+                if len(pending) > 0:
+                    self._addPending(pending)
+                    pending = []
+                if self.semaphore.tryAcquire(1, 500):
+                    pending.append(dataSample)
+                    break
+        if len(pending) > 0:
+            self._addPending(pending)
+
+    def _addPending(self, dataSamples):
+        with QMutexLocker(self._pendingMutex):
+            wakeup = len(self._pending) == 0
+            self._pending.extend(dataSamples)
+        # the receiving thread is only notified when the queue transitions from empty to non-empty, it takes
+        # all samples queued up to that point with a single event
+        if wakeup:
+            self.samplesPending.emit(self)
+
     def setStopped(self, stopped):
         """
         When the connection is stopped (the default), acquire will not deadlock and there is a warning when samples are
@@ -66,7 +124,11 @@ class OutputPortImpl(OutputPortInterface):
     # pylint: disable=abstract-method
     # the Factory function is static and will be assigned later in this module
 
-    # constructor inherited from OutputPort
+    def __init__(self, dynamic, name, environment):
+        super().__init__(dynamic, name, environment)
+        # weak references to the input ports in the same thread, these are called directly without the QT signal
+        # machinery. The list is replaced instead of modified, so that a transmission in progress is not affected.
+        self._directTargets = []
 
     def transmit(self, dataSample):
         """
@@ -76,7 +138,28 @@ class OutputPortImpl(OutputPortInterface):
         """
         if not QThread.currentThread() is self.thread():
             raise NexTRuntimeError("OutputPort.transmit has been called from an unexpected thread.")
+        # inter-thread connections first, so that the receiving threads don't wait for the synchronous receivers
         self.transmitSample.emit(dataSample)
+        for ref in self._directTargets:
+            inputPort = ref()
+            if inputPort is not None:
+                inputPort.receiveSync(dataSample)
+
+    def transmitBatch(self, dataSamples):
+        """
+        transmit a list of data samples over this port
+
+        :param dataSamples: list of samples to transmit
+        """
+        if not QThread.currentThread() is self.thread():
+            raise NexTRuntimeError("OutputPort.transmitBatch has been called from an unexpected thread.")
+        if len(dataSamples) > 0:
+            dataSamples = list(dataSamples)
+            self.transmitSampleBatch.emit(dataSamples)
+            for ref in self._directTargets:
+                inputPort = ref()
+                if inputPort is not None:
+                    inputPort.receiveSyncBatch(dataSamples)
 
     def clone(self, newEnvironment):
         """
@@ -87,6 +170,9 @@ class OutputPortImpl(OutputPortInterface):
         """
         return OutputPortImpl(self.dynamic(), self.name(), newEnvironment)
 
+    def _removeDirectTarget(self, ref):
+        self._directTargets = [r for r in self._directTargets if r is not ref]
+
     @staticmethod
     def setupDirectConnection(outputPort, inputPort):
         """
@@ -98,7 +184,15 @@ class OutputPortImpl(OutputPortInterface):
         :return: None
         """
         logger.info("setup direct connection between %s -> %s", outputPort.name(), inputPort.name())
-        outputPort.transmitSample.connect(inputPort.receiveSync, Qt.DirectConnection)
+        # connections within the same thread bypass the signal/slot mechanism; the connection is removed when the
+        # input port is garbage collected
+        # pylint: disable=protected-access
+        outputPortRef = weakref.ref(outputPort)
+        def removeTarget(ref):
+            port = outputPortRef()
+            if port is not None:
+                port._removeDirectTarget(ref)
+        outputPort._directTargets = outputPort._directTargets + [weakref.ref(inputPort, removeTarget)]
 
     @staticmethod
     def setupInterThreadConnection(outputPort, inputPort, outputPortThread, width):
@@ -115,7 +209,8 @@ class OutputPortImpl(OutputPortInterface):
         logger.info("setup inter thread connection between %s -> %s", outputPort.name(), inputPort.name())
         itc = InterThreadConnection(outputPortThread, width)
         outputPort.transmitSample.connect(itc.receiveSample, Qt.DirectConnection)
-        itc.transmitInterThread.connect(inputPort.receiveAsync, Qt.QueuedConnection)
+        itc.samplesPending.connect(inputPort.receiveAsyncPending, Qt.QueuedConnection)
+        outputPort.transmitSampleBatch.connect(itc.receiveSampleBatch, Qt.DirectConnection)
         return itc
 
 class InputPortImpl(InputPortInterface):
@@ -143,11 +238,10 @@ class InputPortImpl(InputPortInterface):
         except KeyError:
             self.srvprof = None
         self.profname = None
-        # the queue is implemented here as a python list, which is implemented as a c array
-        # in cpython. Not the most performant choice, but it is usually not used because
-        # this is just a reference implementation for the more performant C++ implementation
-        # in cnexxT
-        self.queue = []
+        # the queue is implemented here as a deque, newest samples are at the left end. This avoids copying
+        # the queue for every received sample. Note that this is just a reference implementation for the
+        # more performant C++ implementation in cnexxT
+        self.queue = deque()
 
     def getData(self, delaySamples=0, delaySeconds=None):
         """
@@ -174,13 +268,13 @@ class InputPortImpl(InputPortInterface):
         raise RuntimeError("delaySamples and delaySeconds are both None.")
 
     def _addToQueue(self, dataSample):
-        self.queue.insert(0, dataSample)
+        self.queue.appendleft(dataSample)
         if self._queueSizeSamples is not None and self._queueSizeSamples > 0:
-            if len(self.queue) > self._queueSizeSamples:
-                self.queue = self.queue[:self._queueSizeSamples]
-        if self._queueSizeSeconds is not None and self._queueSizeSeconds > 0.0:
-            queueSizeTime = self._queueSizeSeconds / DataSample.TIMESTAMP_RES
-            while len(self.queue) > 0 and self.queue[0].getTimestamp() - self.queue[-1].getTimestamp() > queueSizeTime:
+            while len(self.queue) > self._queueSizeSamples:
+                self.queue.pop()
+        if self._queueSizeTime is not None:
+            while (len(self.queue) > 0 and
+                   self.queue[0].getTimestamp() - self.queue[-1].getTimestamp() > self._queueSizeTime):
                 self.queue.pop()
 
     def _transmit(self):
@@ -234,6 +328,43 @@ class InputPortImpl(InputPortInterface):
                 logger.internal("delta = %d: semaphoreN = %d", delta, self._semaphoreN[semaphore])
                 self._transmit()
 
+    def receiveAsyncBatch(self, dataSamples, semaphore):
+        """
+        Called from framework only and implements the asynchronous receive mechanism for a list of samples. The
+        semaphore has been acquired once per sample by the caller.
+
+        :param dataSamples: the list of transmitted DataSample instances
+        :param semaphore: a QSemaphore instance
+        :return: None
+        """
+        return self._receiveAsyncBatch(dataSamples, semaphore)
+
+    @handleException
+    def _receiveAsyncBatch(self, dataSamples, semaphore):
+        if not QThread.currentThread() is self.thread():
+            raise NexTInternalError("InputPort.receiveAsyncBatch has been called from an unexpected thread.")
+        if self._interthreadDynamicQueue and semaphore is not None:
+            # the semaphore accounting of the dynamic queue is done per sample
+            for dataSample in dataSamples:
+                self._receiveAsync(dataSample, semaphore)
+            return
+        try:
+            for dataSample in dataSamples:
+                self._addToQueue(dataSample)
+                self._transmit()
+        finally:
+            if semaphore is not None:
+                semaphore.release(len(dataSamples))
+
+    def receiveAsyncPending(self, interThreadConnection):
+        """
+        Called from framework only when an inter-thread connection has samples pending for this port.
+
+        :param interThreadConnection: an InterThreadConnection instance
+        :return: None
+        """
+        return self._receiveAsyncBatch(interThreadConnection.takePendingSamples(), interThreadConnection.semaphore)
+
     def receiveSync(self, dataSample):
         """
         Called from framework only and implements the synchronous receive mechanism.
@@ -250,6 +381,16 @@ class InputPortImpl(InputPortInterface):
         self._addToQueue(dataSample)
         self._transmit()
 
+    def receiveSyncBatch(self, dataSamples):
+        """
+        Called from framework only and implements the synchronous receive mechanism for a list of samples.
+
+        :param dataSamples: the list of transmitted DataSample instances
+        :return: None
+        """
+        for dataSample in dataSamples:
+            self._receiveSync(dataSample)
+
     def clone(self, newEnvironment):
         """
         Return a copy of this port attached to a new environment.
@@ -276,6 +417,9 @@ class InputPortImpl(InputPortInterface):
             queueSizeSamples = 1
         self._queueSizeSamples = queueSizeSamples
         self._queueSizeSeconds = queueSizeSeconds
+        # the time limit of the queue in timestamp units, computed here once instead of per received sample
+        self._queueSizeTime = (queueSizeSeconds / DataSample.TIMESTAMP_RES
+                               if queueSizeSeconds is not None and queueSizeSeconds > 0.0 else None)
 
     def queueSizeSamples(self):
         """
@@ -27,6 +27,9 @@ class Property:
     """
     This class represents a specific property.
     """
+    # properties are stored per filter and accessed frequently, slots give a compact layout and fast attribute access
+    __slots__ = ["defaultVal", "value", "helpstr", "handler", "useEnvironment", "used"]
+
     def __init__(self, defaultVal, helpstr, handler):
         self.defaultVal = defaultVal
         self.value = defaultVal
@@ -184,9 +187,9 @@ class PropertyCollectionImpl(PropertyCollection):
     def getProperty(self, name, subst=True, variables=None):
         self._accessed = True
         with QMutexLocker(self._propertyMutex):
-            if name not in self._properties:
+            p = self._properties.get(name)
+            if p is None:
                 raise PropertyCollectionPropertyNotFound(name)
-            p = self._properties[name]
             p.used = True
             if p.useEnvironment and subst:
                 if variables is None:
@@ -206,6 +209,19 @@ class PropertyCollectionImpl(PropertyCollection):
             p = self._properties[name]
             return p
 
+    def getRawProperty(self, name):
+        """
+        returns the unsubstituted value and the indirect flag of the property identified by name. Both are read while
+        holding the property mutex, so they are consistent even if the property is changed from another thread.
+        :param name: the property name
+        :return: a (value, useEnvironment) tuple
+        """
+        with QMutexLocker(self._propertyMutex):
+            p = self._properties.get(name)
+            if p is None:
+                raise PropertyCollectionPropertyNotFound(name)
+            return p.value, p.useEnvironment
+
     def getAllPropertyNames(self):
         """
         Query all property names handled in this collection
@@ -214,6 +230,9 @@ class PropertyCollectionImpl(PropertyCollection):
         return list(self._properties.keys())
 
     @Slot(str, str)
+    @Slot(str, int)
+    @Slot(str, float)
+    @Slot(str, bool)
     def setProperty(self, name, value):
         """
         Set the value of a named property.
@@ -427,6 +446,12 @@ class PropertyCollectionProxy(PropertyCollection):
         """
         return self._proxiedPropColl.getPropertyDetails(self, name)
 
+    def getRawProperty(self, name):
+        """
+        See PropertyCollectionImpl.getRawProperty for details
+        """
+        return self._proxiedPropColl.getRawProperty(name)
+
     def getAllPropertyNames(self):
         """
         Query all property names handled in this collection
@@ -435,6 +460,9 @@ class PropertyCollectionProxy(PropertyCollection):
         return self._proxiedPropColl.getAllPropertyNames()
 
     @Slot(str, str)
+    @Slot(str, int)
+    @Slot(str, float)
+    @Slot(str, bool)
     def setProperty(self, name, value):
         """
         Set the value of a named property.
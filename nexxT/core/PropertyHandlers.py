@@ -20,6 +20,8 @@ class IntHandler(PropertyHandler):
     The property handler for integer properties; Supported options: min and max.
     """
 
+    __slots__ = ["_options"]
+
     def __init__(self, options):
         """
         Constructor
@@ -139,6 +141,8 @@ class StringHandler(PropertyHandler):
     The property handler for string properties; Supported options: enum
     """
 
+    __slots__ = ["_options"]
+
     def __init__(self, options):
         for k in options:
             if k == "enum":
@@ -241,6 +245,8 @@ class FloatHandler(PropertyHandler):
     The property handler for float properties; Supported options: min and max.
     """
 
+    __slots__ = ["_options"]
+
     def __init__(self, options):
         for k in options:
             if k in ["min", "max"]:
@@ -340,6 +346,8 @@ class BoolHandler(PropertyHandler):
     The property handler for boo. properties; Supported options: none
     """
 
+    __slots__ = ["_options"]
+
     def __init__(self, options):
         for k in options:
             raise PropertyParsingError(f"Unexpected option {k}.")
@@ -14,6 +14,7 @@
 #define NEXXT_DATA_SAMPLES_HPP
 
 #include <cstdint>
+#include <functional>
 #include <QtCore/QByteArray>
 #include <QtCore/QString>
 #include <QtCore/QSharedPointer>
@@ -74,6 +75,31 @@ namespace nexxT
         */
         static SharedDataSamplePtr make_shared(DataSample *sample);
 
+        /*!
+            Create a new DataSample instance and return a shared pointer referencing it. This is the same as
+            make_shared(new DataSample(content, datatype, timestamp)), but needs only a single call from python.
+        */
+        static SharedDataSamplePtr make(const QByteArray &content, const QString &datatype, int64_t timestamp);
+
+        /*!
+            Create a data sample referencing external memory without copying it. The memory is not copied when the
+            sample is transmitted. The release callback is called when the sample is destroyed, i.e. after all
+            receivers have released their references.
+
+            The memory must not be modified until the release callback has been called. Because the receivers can't
+            know how a sample has been created, getContent() and copy() return a detached copy of the memory for
+            these samples, so the returned QByteArray instances stay valid after the sample has been released. This
+            function is not available in python.
+
+            @param data pointer to the external memory
+            @param size size of the external memory in bytes
+            @param datatype the data type of the sample
+            @param timestamp the timestamp of the sample
+            @param release callback called when the memory is not referenced anymore (might be empty)
+        */
+        static SharedDataSamplePtr fromRawData(const char *data, qsizetype size, const QString &datatype,
+                                               int64_t timestamp, const std::function<void()> &release);
+
         /*!
             See \verbatim embed:rst:inline :py:meth:`nexxT.interface.DataSamples.DataSample.currentTime` \endverbatim
         */
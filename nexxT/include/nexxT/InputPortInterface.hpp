@@ -49,6 +49,13 @@ namespace nexxT
         */
         virtual ~InputPortInterface();
 
+        /*!
+            Create a new InputPortInterface instance and return a shared pointer referencing it. Used as the
+            implementation of the python factory function, see
+            \verbatim embed:rst:inline :py:func:`nexxT.interface.Ports.InputPort` \endverbatim.
+        */
+        static SharedPortPtr make(bool dynamic, const QString &name, BaseFilterEnvironment *environment, int queueSizeSamples = 1, double queueSizeSeconds = -1.0);
+
         /*!
             See \verbatim embed:rst:inline :py:meth:`nexxT.interface.Ports.InputPortInterface.getData`
             \endverbatim.
@@ -98,6 +105,14 @@ namespace nexxT
             Called by the nexxT framework, not intended to be used directly.
         */
         void receiveSync (const QSharedPointer<const nexxT::DataSample> &sample);
+        /*!
+            Called by the nexxT framework, not intended to be used directly.
+        */
+        void receiveAsyncBatch(const QList<QSharedPointer<const nexxT::DataSample> > &samples, QSemaphore *semaphore);
+        /*!
+            Called by the nexxT framework, not intended to be used directly.
+        */
+        void receiveSyncBatch(const QList<QSharedPointer<const nexxT::DataSample> > &samples);
 
     private:
         void addToQueue(const SharedDataSamplePtr &sample);
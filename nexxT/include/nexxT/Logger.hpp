@@ -17,6 +17,7 @@
 #include "nexxT/NexxTLinkage.hpp"
 #include "SharedPointerTypes.hpp"
 #include <QtCore/QMetaObject>
+#include <QtCore/QMetaMethod>
 
 //! @cond Doxygen_Suppress
 #define NEXXT_LOG_LEVEL_NOTSET 0
@@ -72,6 +73,8 @@ namespace nexxT
     {
         static unsigned int loglevel;
         static SharedQObjectPtr loggingService;
+        /* the log(...) slot of the logging service, resolved once in setLoggingService */
+        static QMetaMethod logMethod;
         static void _log(unsigned int level, const QString &message, const QString &file, unsigned int line);
     public:
         static void setLogLevel(unsigned int level);
@@ -22,6 +22,7 @@
 namespace nexxT
 {
     class BaseFilterEnvironment;
+    struct OutputPortD;
  
     /*!
         This class is the C++ variant of \verbatim embed:rst:inline :py:class:`nexxT.interface.Ports.OutputPortInterface`
@@ -32,6 +33,8 @@ namespace nexxT
     class DLLEXPORT OutputPortInterface : public Port
     {
         Q_OBJECT
+
+        OutputPortD *const d;
         
     signals:
         /*!
@@ -42,6 +45,14 @@ namespace nexxT
             \endverbatim.
         */
         void transmitSample(const QSharedPointer<const nexxT::DataSample> &sample);
+        /*!
+            QT signal for transmitting a list of samples over threads. Note that this signal is not intended to be used
+            directly. Use the transmitBatch method instead.
+
+            See \verbatim embed:rst:inline :py:attr:`nexxT.interface.Ports.OutputPortInterface.transmitSampleBatch`
+            \endverbatim.
+        */
+        void transmitSampleBatch(const QList<QSharedPointer<const nexxT::DataSample> > &samples);
 
     public:
         /*!
@@ -51,11 +62,20 @@ namespace nexxT
             \endverbatim.
         */
         OutputPortInterface(bool dynamic, const QString &name, BaseFilterEnvironment *env);
+        /*!
+            Destructor
+        */
+        virtual ~OutputPortInterface();
         /*!
             See \verbatim embed:rst:inline :py:meth:`nexxT.interface.Ports.OutputPortInterface.transmit`
             \endverbatim.
         */
         void transmit(const SharedDataSamplePtr &sample);
+        /*!
+            See \verbatim embed:rst:inline :py:meth:`nexxT.interface.Ports.OutputPortInterface.transmitBatch`
+            \endverbatim.
+        */
+        void transmitBatch(const QList<SharedDataSamplePtr> &samples);
         /*!
             See \verbatim embed:rst:inline :py:meth:`nexxT.interface.Ports.OutputPortInterface.clone`
             \endverbatim.
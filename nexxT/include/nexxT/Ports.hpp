@@ -88,15 +88,21 @@ namespace nexxT
         Q_OBJECT
 
         InterThreadConnectionD *const d;
+
+        void addPending(const QList<QSharedPointer<const nexxT::DataSample> > &samples);
     public:
         InterThreadConnection(QThread *qthread_from, int width);
         virtual ~InterThreadConnection();
 
+        QList<QSharedPointer<const nexxT::DataSample> > takePendingSamples();
+        QSemaphore *semaphore();
+
     signals:
-        void transmitInterThread(const QSharedPointer<const nexxT::DataSample> &sample, QSemaphore *semaphore);
+        void samplesPending(nexxT::InterThreadConnection *itc);
 
     public slots:
         void receiveSample(const QSharedPointer<const nexxT::DataSample> &sample);
+        void receiveSampleBatch(const QList<QSharedPointer<const nexxT::DataSample> > &samples);
         void setStopped(bool stopped);
     };
 //! @endcond
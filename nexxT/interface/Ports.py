@@ -126,6 +126,25 @@ class OutputPortInterface(Port):
 
     # constructor inherited from Port
     transmitSample = Signal(object)
+    """
+    QT signal for transmitting a sample to the connected input ports. Note that this signal is not intended to be used
+    directly. Use the transmit method instead.
+
+    The C++ implementation declares this signal with the concrete, registered meta type
+    :code:`QSharedPointer<const nexxT::DataSample>`, so that the sample pointer is passed directly through Qt's
+    meta-call system without being wrapped into a generic python object. This python reference implementation
+    uses :code:`object` because the python DataSample is not a registered meta type.
+
+    :param dataSample: the transmitted DataSample instance
+    """
+
+    transmitSampleBatch = Signal(object)
+    """
+    QT signal for transmitting a list of samples to the connected input ports. Note that this signal is not intended
+    to be used directly. Use the transmitBatch method instead.
+
+    :param dataSamples: a list of DataSample instances
+    """
 
     def transmit(self, dataSample):
         """
@@ -135,6 +154,16 @@ class OutputPortInterface(Port):
         """
         raise NotImplementedError()
 
+    def transmitBatch(self, dataSamples):
+        """
+        transmit a list of data samples over this port. The receiving filters see the same sequence of samples as if
+        transmit(...) has been called for each sample, but inter-thread connections dispatch the samples with a
+        single event where possible. This is useful for sources with high data rates.
+
+        :param dataSamples: a list of samples to transmit
+        """
+        raise NotImplementedError()
+
     def clone(self, newEnvironment):
         """
         Return a copy of this port attached to a new environment.
@@ -198,6 +227,17 @@ class InputPortInterface(Port):
         """
         raise NotImplementedError()
 
+    def receiveAsyncBatch(self, dataSamples, semaphore):
+        """
+        Called from framework only and implements the asynchronous receive mechanism for a list of samples. The
+        semaphore has been acquired once per sample by the caller and it is released for the whole batch at once.
+
+        :param dataSamples: a list of transmitted DataSample instances
+        :param semaphore: a QSemaphore instance
+        :return: None
+        """
+        raise NotImplementedError()
+
     def receiveSync(self, dataSample):
         """
         Called from framework only and implements the synchronous receive mechanism. TODO implement
@@ -207,6 +247,15 @@ class InputPortInterface(Port):
         """
         raise NotImplementedError()
 
+    def receiveSyncBatch(self, dataSamples):
+        """
+        Called from framework only and implements the synchronous receive mechanism for a list of samples.
+
+        :param dataSamples: a list of transmitted DataSample instances
+        :return: None
+        """
+        raise NotImplementedError()
+
     def clone(self, newEnvironment):
         """
         Return a copy of this port attached to a new environment.
@@ -220,6 +269,11 @@ class InputPortInterface(Port):
         """
         Set the queue size of this port.
 
+        The queue size defines the history of samples accessible through getData(...), it is not a buffer for
+        samples waiting to be processed. Samples pending between threads are limited by the width of the connection
+        (1 sample by default, unlimited for non-blocking connections) and, if enabled, by
+        setInterthreadDynamicQueue(...).
+
         :param queueSizeSamples: 0 related the most actual sample, numbers > 0 relates to historic samples (None can be
                                  given if delaySeconds is not None)
         :param queueSizeSeconds: if not None, a delay of 0.0 is related to the current sample, positive numbers are
@@ -31,6 +31,9 @@ class PropertyHandler:
         :cpp:class:`nexxT::PropertyHandler`
     """
 
+    # no per-instance __dict__ for the handlers, there is one handler instance per property
+    __slots__ = ()
+
     def options(self):
         """
         Returns the options set for this handler as a QVariantMap
@@ -201,6 +204,10 @@ class PropertyCollection(QObject):
         raise NotImplementedError()
 
     @Slot(str, object)
+    @Slot(str, str)
+    @Slot(str, int)
+    @Slot(str, float)
+    @Slot(str, bool)
     def setProperty(self, name, value):
         """
         Set the value of a named property.
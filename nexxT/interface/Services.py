@@ -8,9 +8,60 @@
 This module defines the Services class of the nexxT framework.
 """
 import logging
+from types import MappingProxyType
+from nexxT.Qt.QtCore import QRecursiveMutex, QMutexLocker
 
 logger = logging.getLogger(__name__)
 
+# the registered services, this dictionary must be modified in place and never be re-assigned
+_services = {}
+# modifications of the services dictionary are serialized with this mutex, lookups don't need to lock because
+# single dictionary operations are atomic in python
+_mutex = QRecursiveMutex()
+
+def addService(name, service):
+    """
+    Publish a named service.
+
+    :param name: the name of the service
+    :param service: a QObject instance
+    :return: None
+    """
+    with QMutexLocker(_mutex):
+        # the usual case of a new service needs only one dictionary lookup
+        prev = _services.setdefault(name, service)
+        if prev is not service:
+            logger.warning("Service %s already existing, automatically replacing it with the new variant.", name)
+            _services[name] = service
+
+# getService is called frequently, so it is directly bound to the dictionary's lookup method without locking.
+getService = _services.__getitem__
+
+def removeService(name):
+    """
+    Remove the given named service
+
+    :param name: the name of the service
+    :return: the related QObject instance
+    """
+    with QMutexLocker(_mutex):
+        try:
+            _services[name].detach()
+        except: # pylint: disable=bare-except
+            pass
+        del _services[name]
+
+def removeAll():
+    """
+    Remove all registered services
+
+    :return: None
+    """
+    # remove the services one by one to call the detach slots, the dictionary is modified in place
+    with QMutexLocker(_mutex):
+        for name in list(_services.keys()):
+            removeService(name)
+
 class Services:
     """
     .. note::
@@ -39,50 +90,17 @@ class Services:
         differences between the wrapped C++ class and this python class. The C++ interface is defined in
         :cpp:class:`nexxT::Services`
     """
-    services = {}
-
-    @staticmethod
-    def addService(name, service):
-        """
-        Publish a named service.
-
-        :param name: the name of the service
-        :param service: a QObject instance
-        :return: None
-        """
-        if name in Services.services:
-            logger.warning("Service %s already existing, automatically replacing it with the new variant.")
-        Services.services[name] = service
-
-    @staticmethod
-    def getService(name):
-        """
-        Query a named service
-
-        :param name: the name of the service
-        :return: the related QObject instance
-        """
-        return Services.services[name]
-
-    @staticmethod
-    def removeService(name):
-        """
-        Remove the given named service
-
-        :param name: the name of the service
-        :return: the related QObject instance
-        """
-        try:
-            Services.services[name].detach()
-        except: # pylint: disable=bare-except
-            pass
-        del Services.services[name]
+    # read-only view of the registered services, it always reflects the current state of the services dictionary
+    services = MappingProxyType(_services)
 
-    @staticmethod
-    def removeAll():
-        """
-        Remove all registered services
+    # the class is a namespace for the module level functions, kept for API compatibility with the C++ version
+    addService = staticmethod(addService)
+    getService = staticmethod(getService)
+    """
+    Query a named service
 
-        :return: None
-        """
-        Services.services = {}
+    :param name: the name of the service
+    :return: the related QObject instance
+    """
+    removeService = staticmethod(removeService)
+    removeAll = staticmethod(removeAll)
@@ -17,18 +17,21 @@ if nexxT.useCImpl:
     Filter = cnexxT.Filter
     FilterState = cnexxT.FilterState
 
-    def DataSample(*args, **kw):
+    # the factory functions below bind the resolved cnexxT attributes as default arguments to save the module global
+    # and attribute lookups for each call; these arguments are not intended to be passed by callers.
+    _cDataSample = cnexxT.DataSample
+
+    def DataSample(*args, _make=_cDataSample.make, **kw):
         """
         DataSample factory function (create a shared pointer to a new DataSample instance)
         """
-        return cnexxT.DataSample.make_shared(cnexxT.DataSample(*args, **kw))
+        return _make(*args, **kw)
     #DataSample = lambda *args, **kw: cnexxT.DataSample.make_shared(cnexxT.DataSample(*args, **kw))
 
-    DataSample.TIMESTAMP_RES = cnexxT.DataSample.TIMESTAMP_RES
-    DataSample.copy = cnexxT.DataSample.copy
-    DataSample.currentTime = cnexxT.DataSample.currentTime
-    cnexxT.DataSample.registerMetaType()
-    cnexxT.DataSample.registerMetaType()
+    DataSample.TIMESTAMP_RES = _cDataSample.TIMESTAMP_RES
+    DataSample.copy = _cDataSample.copy
+    DataSample.currentTime = _cDataSample.currentTime
+    _cDataSample.registerMetaType()
     Port = cnexxT.Port
     OutputPortInterface = cnexxT.OutputPortInterface
     InputPortInterface = cnexxT.InputPortInterface
@@ -36,22 +39,21 @@ if nexxT.useCImpl:
     PropertyHandler = cnexxT.PropertyHandler
     Services = cnexxT.Services
 
-    def OutputPort(*args, **kw):
+    def OutputPort(*args, _makeShared=Port.make_shared, _outputPort=OutputPortInterface, **kw):
         """
         OutputPort factory function (create a shared pointer to a new OutputPortInterface instance)
         """
-        return Port.make_shared(OutputPortInterface(*args, **kw))
+        return _makeShared(_outputPort(*args, **kw))
     #OutputPort = lambda *args, **kw: Port.make_shared(OutputPortInterface(*args, **kw))
 
-    def InputPort(dynamic, name, environment, queueSizeSamples=1, queueSizeSeconds=-1):
-        """
-        InputPort factory function (create a shared pointer to a new InputPortInterface instance)
-        """
-        return Port.make_shared(InputPortInterface(dynamic, name, environment, queueSizeSamples, queueSizeSeconds))
+    # InputPort factory function (create a shared pointer to a new InputPortInterface instance), the default
+    # arguments are handled in C++
+    InputPort = InputPortInterface.make
     #InputPort = (lambda dynamic, name, environment, queueSizeSamples=1, queueSizeSeconds=-1:
     #        Port.make_shared(InputPortInterface(dynamic, name, environment, queueSizeSamples, queueSizeSeconds)))
 
     from nexxT.interface.Filters import FilterSurrogate
+    del _cDataSample
 else:
     # pylint: enable=invalid-name
     from nexxT.interface.Ports import Port
@@ -9,6 +9,7 @@ This module provides a service which maps log messages coming from c++ and qt to
 It is automatically used by NEXT_LOG_*() macros in c++.
 """
 
+import functools
 import logging
 import os.path
 import sys
@@ -17,27 +18,73 @@ from nexxT.core.Utils import excepthook
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=512)
+def _cplusplusLoggerName(filename):
+    """
+    Return the logger name used for log messages originating from the given source file. The result is cached,
+    because the same source files are logging over and over again.
+
+    :param filename: the name of the source file
+    :return: a string
+    """
+    return f"c++/{os.path.basename(filename)}"
+
 # see https://stackoverflow.com/questions/32443808/best-way-to-override-lineno-in-python-logger
 # pylint: disable=too-many-arguments
 # pylint: disable=unused-argument
-def makeRecord(self, name, level, filename, lineno, msg, args, excInfo, func=None, extra=None, sinfo=None):
+def makeRecord(self, name, level, filename, lineno, msg, args, excInfo, func=None, extra=None, sinfo=None,
+               _logRecord=logging.LogRecord, _loggerName=_cplusplusLoggerName):
     """
     A factory method which can be overridden in subclasses to create
     specialized LogRecords.
+
+    The arguments _logRecord and _loggerName are bound at definition time to save global lookups for every log
+    record, they are not intended to be passed by callers.
     """
     if extra is not None:
         filename, lineno = extra
-        name = f"c++/{os.path.split(filename)[1]}"
-    return logging.LogRecord(name, level, filename, lineno, msg, args, excInfo, func, sinfo)
+        name = _loggerName(filename)
+    return _logRecord(name, level, filename, lineno, msg, args, excInfo, func, sinfo)
 # pylint: enable=too-many-arguments
 # pylint: enable=unused-argument
 
 logger.__class__ = type("CplusplusLogger", (logger.__class__,), dict(makeRecord=makeRecord))
 
+# mapping of qt message types to python log levels, used for every qt message
+# note: a tuple indexed by the enum's integer value is not faster here, because PySide6 enums are python enums, so
+# int() is not supported and accessing .value costs more than hashing the enum member.
+_QT_LOG_LEVELS = {QtMsgType.QtDebugMsg : logging.DEBUG,
+                  QtMsgType.QtInfoMsg : logging.INFO,
+                  QtMsgType.QtWarningMsg : logging.WARNING,
+                  QtMsgType.QtCriticalMsg : logging.CRITICAL,
+                  QtMsgType.QtFatalMsg : logging.FATAL}
+
 class ConsoleLogger(QObject):
     """
     Logging service to console (using python logging module). This class is used to log messages in C++.
     """
+    _installed = False
+
+    def __init__(self):
+        """
+        Constructor, installs the message handlers if not already done.
+        """
+        super().__init__()
+        self.install()
+
+    @staticmethod
+    def install():
+        """
+        Installs the qt message handler and the python exception hook. This is done on the first instantiation of a
+        logging service and not at import time, so that importing this module doesn't have side effects.
+
+        :return:
+        """
+        if not ConsoleLogger._installed:
+            ConsoleLogger._installed = True
+            qInstallMessageHandler(ConsoleLogger.qtMessageHandler)
+            sys.excepthook = excepthook
+
     @Slot(int, str, str, int)
     def log(self, level, message, file, line):
         """
@@ -49,7 +96,10 @@ class ConsoleLogger(QObject):
         :param line: line of log message statement
         :return:
         """
-        logger.log(level, message, extra=(file, line))
+        # the c++ side already filters by the nexxT log level, this filters by the python logger's level before
+        # the log call's argument handling takes place
+        if logger.isEnabledFor(level):
+            logger.log(level, message, extra=(file, line))
 
     @staticmethod
     def qtMessageHandler(qtMsgType, qMessageLogContext, msg):
@@ -61,13 +111,5 @@ class ConsoleLogger(QObject):
         :param msg: message as a string
         :return:
         """
-        typeMap = {QtMsgType.QtDebugMsg : logging.DEBUG,
-                   QtMsgType.QtInfoMsg : logging.INFO,
-                   QtMsgType.QtWarningMsg : logging.WARNING,
-                   QtMsgType.QtCriticalMsg : logging.CRITICAL,
-                   QtMsgType.QtFatalMsg : logging.FATAL}
-        logger.log(typeMap[qtMsgType], msg, extra=(qMessageLogContext.file if qMessageLogContext.file is not None
-                                                   else "<qt>", qMessageLogContext.line))
-
-qInstallMessageHandler(ConsoleLogger.qtMessageHandler)
-sys.excepthook = excepthook
+        # the file is None (or empty) for release builds of qt, "or" handles both with a single attribute access
+        logger.log(_QT_LOG_LEVELS[qtMsgType], msg, extra=(qMessageLogContext.file or "<qt>", qMessageLogContext.line))
@@ -9,7 +9,8 @@ This module provides the basic Configuration services of the nexxT framework.
 """
 
 import logging
-from nexxT.Qt.QtCore import (QObject, Slot, Qt, QAbstractItemModel, QModelIndex, QMimeData)
+from contextlib import contextmanager
+from nexxT.Qt.QtCore import (QObject, Slot, Qt, QAbstractItemModel, QModelIndex, QMimeData, QTimer)
 from nexxT.Qt.QtGui import QFont, QIcon
 from nexxT.Qt.QtWidgets import QStyle, QApplication
 from nexxT.core.Exceptions import NexTRuntimeError
@@ -26,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 ITEM_ROLE = Qt.UserRole + 4223
 
+_COMPOSITE_MIME_TYPE = "application/x-nexxT-compositefilter"
+
 class ConfigurationModel(QAbstractItemModel):
     """
     This class encapsulates a next Configuration item in a QAbstractItemModel ready for usage in a QTreeView.
@@ -37,66 +40,256 @@ class ConfigurationModel(QAbstractItemModel):
 
     class Item:
         """
-        An item instance for creating the item tree. Items have children, a parent and arbitrary content.
+        An item instance for creating the item tree. Items have children, a parent and arbitrary content. Children
+        can optionally be registered with a key for fast lookup in the parent's childByKey dictionary.
         """
-        def __init__(self, parent, content):
+        # there is one item per row in the model, so avoid the per-instance dictionaries of this and the content classes
+        __slots__ = ["_row", "children", "childByKey", "pendingChildren", "parent", "content", "childColumnCount"]
+
+        def __init__(self, parent, content, key=None):
             if parent is not None:
+                # children are always appended, so the row is known here and it is cached for fast parent() calls
+                self._row = len(parent.children)
                 parent.children.append(self)
+                if key is not None:
+                    parent.childByKey[key] = self
+            else:
+                self._row = 0
             self.children = []
+            self.childByKey = {}
+            # if True, the children have not yet been created, see ConfigurationModel._populateNode
+            self.pendingChildren = False
             self.parent = parent
             self.content = content
+            # the number of columns of the children is queried very often, so it is determined once here
+            self.childColumnCount = ConfigurationModel.CHILD_COLUMN_COUNT.get(type(content), 1)
 
         def row(self):
             """
             :return: the index of this item in the parent item.
             """
-            return self.parent.children.index(self)
+            return self._row
+
+        def removeChild(self, row, keys):
+            """
+            Removes the child at the given row and updates the cached rows of the following children.
+
+            :param row: the row of the child to be removed
+            :param keys: the keys the child has been registered with
+            :return:
+            """
+            children = self.children
+            del children[row]
+            for r in range(row, len(children)):
+                children[r]._row = r
+            for key in keys:
+                del self.childByKey[key]
 
     class NodeContent:
         """
         A node in a subconfig, for usage within the model
         """
-        def __init__(self, subConfig, name):
+        __slots__ = ["subConfig", "name", "propertyCollection", "composite"]
+
+        def __init__(self, subConfig, name, propertyCollection=None, composite=False):
             self.subConfig = subConfig
             self.name = name
+            self.propertyCollection = propertyCollection
+            self.composite = composite
 
     class PropertyContent:
         """
         A property in a propertyCollection, for usage within the model.
         """
+        __slots__ = ["name", "property", "details", "lastView"]
+
         def __init__(self, name, propertyCollection):
             self.name = name
             self.property = propertyCollection
+            # the details instance is kept by the collection until the property is removed
+            self.details = propertyCollection.getPropertyDetails(name)
+            # the last displayed value and the indirect flag, used to skip updates which don't change the view
+            self.lastView = None
+
+        def view(self):
+            """
+            Returns the displayed value and the indirect flag. They are cached until the property is changed.
+
+            :return: a (value, useEnvironment) tuple
+            """
+            if self.lastView is None:
+                # the property might be changed from another thread, so value and flag are read with a locked accessor
+                value, useEnvironment = self.property.getRawProperty(self.name)
+                self.lastView = (value if useEnvironment else self.details.handler.toViewValue(value), useEnvironment)
+            return self.lastView
 
     class SubConfigContent:
         """
         A subConfiguration, for usage within the model.
         """
+        __slots__ = ["subConfig", "configType", "icon"]
+
         def __init__(self, subConfig):
             self.subConfig = subConfig
+            # the type of a subconfig never changes
+            self.configType = Configuration.configType(subConfig)
+            # the decoration icon, depending on the type (assigned on first usage)
+            self.icon = None
 
     class VariableContent:
         """
         A variable definition in a Variables instance, for usage within the model.
         """
+        __slots__ = ["name", "variables"]
+
         def __init__(self, name, variables):
             self.name = name
             self.variables = variables
 
     # Model implementation
 
+    # number of columns of the children of an item, given by the item's content type (default: 1)
+    CHILD_COLUMN_COUNT = {
+        NodeContent: 3, # nodes children have the editable properties with name, value and indirect
+        Variables: 2,
+    }
+
+    # the roles handled in data(...), views are querying many more roles which can be rejected early
+    _HANDLED_ROLES = frozenset([Qt.DisplayRole, Qt.CheckStateRole, Qt.DecorationRole, Qt.FontRole, Qt.ToolTipRole,
+                                ITEM_ROLE])
+
+    # icons and fonts returned by data(...), they are created on first usage because a QApplication is needed
+    _icons = None
+    _boldFont = None
+
+    @classmethod
+    def _decorations(cls):
+        """
+        Returns the icons used for the decoration role, they are created once and shared by all model instances.
+
+        :return: a dictionary mapping icon names to QIcon instances
+        """
+        if cls._icons is None:
+            style = QApplication.style()
+            cls._icons = {
+                "harddisk": QIcon.fromTheme("drive-harddisk", style.standardIcon(QStyle.SP_DriveHDIcon)),
+                "composite": QIcon.fromTheme("repository", style.standardIcon(QStyle.SP_DirLinkIcon)),
+                "application": QIcon.fromTheme("folder", style.standardIcon(QStyle.SP_DirIcon)),
+                "node": QIcon.fromTheme("unknown", style.standardIcon(QStyle.SP_FileIcon)),
+                "variables": QIcon.fromTheme("unknown", style.standardIcon(QStyle.SP_DirIcon)),
+            }
+        return cls._icons
+
+    @classmethod
+    def _activeAppFont(cls):
+        """
+        Returns the font used for the active application, it is created once and shared by all model instances.
+
+        :return: a QFont instance
+        """
+        if cls._boldFont is None:
+            cls._boldFont = QFont()
+            cls._boldFont.setBold(True)
+        return cls._boldFont
+
     def __init__(self, configuration, parent):
         super().__init__(parent)
+        # data(), flags() and setData() are dispatched by the type of the item's content
+        self._dataHandlers = {str: self._dataGroup,
+                              self.SubConfigContent: self._dataSubConfig,
+                              self.NodeContent: self._dataNode,
+                              self.PropertyContent: self._dataProperty,
+                              Variables: self._dataVariables,
+                              self.VariableContent: self._dataVariable}
+        self._flagsHandlers = {self.SubConfigContent: self._flagsSubConfig,
+                               self.NodeContent: self._flagsNode,
+                               self.PropertyContent: self._flagsProperty,
+                               self.VariableContent: self._flagsVariable}
+        self._setDataHandlers = {self.SubConfigContent: self._setDataSubConfig,
+                                 self.NodeContent: self._setDataNode,
+                                 self.PropertyContent: self._setDataProperty,
+                                 self.VariableContent: self._setDataVariable}
         self.root = self.Item(None, configuration)
         self.Item(self.root, "composite")
         self.Item(self.root, "apps")
         vitem = self.Item(self.root, configuration.propertyCollection().getVariables())
         self.activeApp = None
+        self.activeAppItem = None
+        # maps the property collections of the nodes to the node items
+        self._propCollItems = {}
+        # item -> list of QMetaObject.Connection handles, released when the item is removed
+        self._connections = {}
+        # maps the Variables instances to the variables items
+        self._variablesItems = {}
+        # changed property items -> last changed column, they are reported at once from the event loop
+        self._pendingPropertyChanges = {}
+        self._propertyChangeTimer = QTimer(self)
+        self._propertyChangeTimer.setSingleShot(True)
+        self._propertyChangeTimer.setInterval(0)
+        self._propertyChangeTimer.timeout.connect(self._emitPropertyChanges)
+        # when > 0, the model is being reset and single row removals are not reported
+        self._resetDepth = 0
+        configuration.configAboutToClose.connect(self.configAboutToClose)
+        configuration.configClosed.connect(self.configClosed)
         configuration.subConfigAdded.connect(self.subConfigAdded)
         configuration.subConfigRemoved.connect(self.subConfigRemoved)
         configuration.appActivated.connect(self.appActivated)
         self._connectVariables(vitem)
 
+    @Slot()
+    def configAboutToClose(self):
+        """
+        This slot is called before all subconfigs are removed from the configuration. Instead of reporting each removed
+        row, the model is reset once.
+
+        :return:
+        """
+        if self._resetDepth == 0:
+            self._pendingPropertyChanges.clear()
+            self.beginResetModel()
+        self._resetDepth += 1
+
+    @Slot()
+    def configClosed(self):
+        """
+        This slot is called after all subconfigs have been removed from the configuration.
+
+        :return:
+        """
+        self._resetDepth -= 1
+        if self._resetDepth == 0:
+            self.endResetModel()
+
+    @contextmanager
+    def modelReset(self):
+        """
+        Context manager for rebuilding the configuration (e.g. closing and loading it again). The model is reset once
+        for the whole with block instead of reporting each removed and inserted row.
+
+        :return: a context manager
+        """
+        self.configAboutToClose()
+        try:
+            yield self
+        finally:
+            self.configClosed()
+
+    def _beginInsertRows(self, parent, first, last):
+        if self._resetDepth == 0:
+            self.beginInsertRows(parent, first, last)
+
+    def _endInsertRows(self):
+        if self._resetDepth == 0:
+            self.endInsertRows()
+
+    def _beginRemoveRows(self, parent, first, last):
+        if self._resetDepth == 0:
+            self.beginRemoveRows(parent, first, last)
+
+    def _endRemoveRows(self):
+        if self._resetDepth == 0:
+            self.endRemoveRows()
+
     def isSubConfigParent(self, index):
         """
         Returns CONFIG_TYPE_COMPOSITE if the index refers to the group
@@ -150,15 +343,11 @@ class ConfigurationModel(QAbstractItemModel):
         """
         parent = self.indexOfSubConfigParent(subConfig)
         parentItem = parent.internalPointer()
-        if isinstance(subConfig, str):
-            idx = [i for i in range(len(parentItem.children))
-                   if parentItem.children[i].content.subConfig.getName() == subConfig]
-        else:
-            idx = [i for i in range(len(parentItem.children))
-                   if parentItem.children[i].content.subConfig is subConfig]
-        if len(idx) != 1:
+        # subconfig items are registered with both, the subconfig instance and the subconfig name
+        item = parentItem.childByKey.get(subConfig)
+        if item is None:
             raise NexTRuntimeError("Unable to locate subconfig.")
-        return self.index(idx[0], 0, parent)
+        return self.indexOfItem(item)
 
     def indexOfNode(self, subConfig, node):
         """
@@ -168,33 +357,38 @@ class ConfigurationModel(QAbstractItemModel):
         :param node: a node name
         :return: a QModelIndex instance
         """
-        parent = self.indexOfSubConfig(subConfig)
-        parentItem = parent.internalPointer()
-        idx = [i for i in range(len(parentItem.children))
-               if parentItem.children[i].content.name == node]
-        if len(idx) != 1:
+        parentItem = self.indexOfSubConfig(subConfig).internalPointer()
+        item = parentItem.childByKey.get(node)
+        if item is None:
             raise NexTRuntimeError("Unable to locate node.")
-        return self.index(idx[0], 0, parent)
+        return self.indexOfItem(item)
+
+    def indexOfItem(self, item, column=0):
+        """
+        Returns the index of the given item. Because the item rows are cached, this is cheaper than searching the
+        item by its content and it doesn't need the parent's index.
+
+        :param item: an Item instance of this model
+        :param column: the column of the index
+        :return: a QModelIndex instance
+        """
+        return self.createIndex(item.row(), column, item)
 
     def indexOfVariable(self, vitem):
         """
-        Returns the index of the given variable by full-recursive searching.
+        Returns the index of the given variable item. The item's ancestors are checked to be still part of the model.
 
         :param vitem: the variable item to be search for.
         """
-        def _traverse(parent):
-            for r in range(self.rowCount(parent)):
-                index = self.index(r, 0, parent)
-                if index.internalPointer() is vitem:
-                    return index
-                ret = _traverse(index)
-                if ret is not None:
-                    return ret
-            return None
-        res = _traverse(QModelIndex())
-        if res is None:
+        item = vitem
+        while item.parent is not None:
+            siblings = item.parent.children
+            if item.row() >= len(siblings) or siblings[item.row()] is not item:
+                raise NexTRuntimeError("Cannot locate variable item in model.")
+            item = item.parent
+        if item is not self.root:
             raise NexTRuntimeError("Cannot locate variable item in model.")
-        return res
+        return self.indexOfItem(vitem)
 
     def subConfigByNameAndType(self, name, sctype):
         """
@@ -205,16 +399,14 @@ class ConfigurationModel(QAbstractItemModel):
         :return: a SubConfiguration instance
         """
         if sctype is Configuration.CONFIG_TYPE_APPLICATION:
-            found = [c.content.subConfig
-                     for c in self.root.children[1].children if c.content.subConfig.getName() == name]
+            item = self.root.children[1].childByKey.get(name)
         elif sctype is Configuration.CONFIG_TYPE_COMPOSITE:
-            found = [c.content.subConfig
-                     for c in self.root.children[0].children if c.content.subConfig.getName() == name]
+            item = self.root.children[0].childByKey.get(name)
         else:
             raise NexTRuntimeError("Unexpected subconfig type")
-        if len(found) != 1:
+        if item is None:
             raise NexTRuntimeError("Unable to locate subConfig")
-        return found[0]
+        return item.content.subConfig
 
     @Slot(object)
     def subConfigAdded(self, subConfig):
@@ -227,24 +419,70 @@ class ConfigurationModel(QAbstractItemModel):
         parent = self.indexOfSubConfigParent(subConfig)
         parentItem = parent.internalPointer()
         graph = subConfig.getGraph()
-        subConfig.nameChanged.connect(self.subConfigRenamed)
-        graph.nodeAdded.connect(lambda node: self.nodeAdded(subConfig, node))
-        graph.nodeDeleted.connect(lambda node: self.nodeDeleted(subConfig, node))
-        graph.nodeRenamed.connect(lambda oldName, newName: self.nodeRenamed(subConfig, oldName, newName))
-        self.beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
-        self.Item(parentItem, self.SubConfigContent(subConfig))
-        self.endInsertRows()
+        self._beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
+        item = self.Item(parentItem, self.SubConfigContent(subConfig), subConfig)
+        parentItem.childByKey[subConfig.getName()] = item
+        self._endInsertRows()
+        # the slots get the subConfig from the sending graph, so no closures are needed here
+        self._connections[item] = [
+            subConfig.nameChanged.connect(self.subConfigRenamed),
+            graph.nodeAdded.connect(self.onGraphNodeAdded),
+            graph.nodeDeleted.connect(self.onGraphNodeDeleted),
+            graph.nodeRenamed.connect(self.onGraphNodeRenamed),
+        ]
+
+    def _disconnectItem(self, item):
+        """
+        Disconnects the signals connected for the given item and its children, so that neither the model slots nor
+        the closures are called (and kept alive) after the item has been removed.
+
+        :param item: an Item instance
+        :return:
+        """
+        for conn in self._connections.pop(item, ()):
+            QObject.disconnect(conn)
+        self._pendingPropertyChanges.pop(item, None)
+        if isinstance(item.content, Variables):
+            self._variablesItems.pop(item.content, None)
+        for child in item.children:
+            self._disconnectItem(child)
 
     def _connectVariables(self, vitem):
         variables = vitem.content
+        # the variables item is not yet visible to views, so the children are created without notifications
         for vname in variables.keys():
-            self.variableAddedOrChanged(vitem, vname, variables)
-        variables.variableAddedOrChanged.connect(
-            lambda key, _value, self=self, vitem=vitem, variables=variables:
-                self.variableAddedOrChanged(vitem, key, variables))
-        variables.variableDeleted.connect(
-            lambda key, self=self, vitem=vitem:
-                self.variableDeleted(vitem, key))
+            self.Item(vitem, self.VariableContent(vname, variables), vname)
+        self._variablesItems[variables] = vitem
+        self._connections[vitem] = [
+            variables.variableAddedOrChanged.connect(self.onVariableAddedOrChanged),
+            variables.variableDeleted.connect(self.onVariableDeleted),
+        ]
+
+    @Slot(str, str)
+    def onVariableAddedOrChanged(self, key, value): # pylint: disable=unused-argument
+        """
+        Slot connected to the variableAddedOrChanged signal of the Variables instances in the model.
+
+        :param key: the key which is changed or added
+        :param value: the new value
+        :return:
+        """
+        variables = self.sender()
+        vitem = self._variablesItems.get(variables)
+        if vitem is not None:
+            self.variableAddedOrChanged(vitem, key, variables)
+
+    @Slot(str)
+    def onVariableDeleted(self, key):
+        """
+        Slot connected to the variableDeleted signal of the Variables instances in the model.
+
+        :param key: the key which is deleted
+        :return:
+        """
+        vitem = self._variablesItems.get(self.sender())
+        if vitem is not None:
+            self.variableDeleted(vitem, key)
 
     def variableAddedOrChanged(self, parentItem, key, variables):
         """
@@ -254,24 +492,17 @@ class ConfigurationModel(QAbstractItemModel):
         :param key: the key which is changed or added
         :param variables: the Variables instances managing the variables of parentItem
         """
-        parent = self.indexOfVariable(parentItem)
-        assert parent.internalPointer() is parentItem
-        found = False
-        for r in range(self.rowCount(parent)):
-            vcontent_key = self.index(r, 0, parent)
-            vcontent_value = self.index(r, 1, parent)
-            vcontent = vcontent_key.internalPointer()
-            assert isinstance(vcontent, self.Item), repr(vcontent)
-            assert isinstance(vcontent.content, self.VariableContent)
-            if vcontent.content.name == key:
-                self.dataChanged.emit(vcontent_value, vcontent_value)
-                found = True
-        if not found:
-            # var was added
-            self.beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
-            _item = self.Item(parentItem, self.VariableContent(key, variables))
-            self.endInsertRows()
-
+        vitem = parentItem.childByKey.get(key)
+        if vitem is not None:
+            if self._resetDepth == 0:
+                index = self.indexOfItem(vitem, 1)
+                self.dataChanged.emit(index, index)
+        else:
+            # var was added, the parent index is only needed in this case
+            parent = self.indexOfVariable(parentItem)
+            self._beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
+            self.Item(parentItem, self.VariableContent(key, variables), key)
+            self._endInsertRows()
 
     def variableDeleted(self, vitem, key):
         """
@@ -282,14 +513,13 @@ class ConfigurationModel(QAbstractItemModel):
         """
         assert isinstance(vitem, ConfigurationModel.Item)
         parent = self.indexOfVariable(vitem)
-        for row, v in enumerate(vitem.children):
-            assert isinstance(v, ConfigurationModel.Item) and isinstance(v.content, ConfigurationModel.VariableContent)
-            if v.content.name == key:
-                self.beginRemoveRows(parent, row, row)
-                vitem.children = vitem.children[:row] + vitem.children[row+1:]
-                self.endRemoveRows()
-                return
-        raise RuntimeError("did not find matching variables object to be deleted.")
+        v = vitem.childByKey.get(key)
+        if v is None:
+            raise RuntimeError("did not find matching variables object to be deleted.")
+        row = v.row()
+        self._beginRemoveRows(parent, row, row)
+        vitem.removeChild(row, [key])
+        self._endRemoveRows()
 
     @Slot(object)
     def subConfigRenamed(self, subConfig, oldName): # pylint: disable=unused-argument
@@ -300,11 +530,15 @@ class ConfigurationModel(QAbstractItemModel):
         :param oldName: the old name of this subConfig
         :return:
         """
+        if oldName == subConfig.getName():
+            return
         index = self.indexOfSubConfig(subConfig)
-        if (self.activeApp is not None and
-                subConfig is self.subConfigByNameAndType(self.activeApp, Configuration.CONFIG_TYPE_APPLICATION)):
+        parentItem = index.parent().internalPointer()
+        parentItem.childByKey[subConfig.getName()] = parentItem.childByKey.pop(oldName)
+        if self.activeAppItem is not None and self.activeAppItem.content.subConfig is subConfig:
             self.activeApp = subConfig.getName()
-        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        if self._resetDepth == 0:
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
 
     @Slot(str, int)
     def subConfigRemoved(self, name, sctype):
@@ -323,9 +557,12 @@ class ConfigurationModel(QAbstractItemModel):
         if sctype == Configuration.CONFIG_TYPE_APPLICATION and name == self.activeApp:
             self.appActivated("", None)
         idx = index.row()
-        self.beginRemoveRows(parent, idx, idx)
-        parentItem.children = parentItem.children[:idx] + parentItem.children[idx+1:]
-        self.endRemoveRows()
+        for nodeItem in index.internalPointer().children:
+            self._propCollItems.pop(nodeItem.content.propertyCollection, None)
+        self._disconnectItem(index.internalPointer())
+        self._beginRemoveRows(parent, idx, idx)
+        parentItem.removeChild(idx, [subConfig, name])
+        self._endRemoveRows()
 
     @Slot(str, object)
     def appActivated(self, name, app):
@@ -336,22 +573,57 @@ class ConfigurationModel(QAbstractItemModel):
         :param app: the Application instance
         :return:
         """
-        if self.activeApp is not None:
-            try:
-                subConfig = self.subConfigByNameAndType(self.activeApp, Configuration.CONFIG_TYPE_APPLICATION)
-                parent = self.indexOfSubConfig(subConfig)
-                index = parent.row()
+        if self.activeAppItem is not None and name == self.activeApp and app is not None:
+            # the application is already active
+            return
+        if self.activeAppItem is not None:
+            item = self.activeAppItem
+            self.activeApp = None
+            self.activeAppItem = None
+            if self._resetDepth == 0:
+                index = self.indexOfItem(item)
                 self.dataChanged.emit(index, index, [Qt.FontRole])
-                self.activeApp = None
-            except NexTRuntimeError:
-                logger.exception("error during resetting active app (ignored)")
 
         if name != "" and app is not None:
-            subConfig = self.subConfigByNameAndType(name, Configuration.CONFIG_TYPE_APPLICATION)
-            parent = self.indexOfSubConfig(subConfig)
+            item = self.root.children[1].childByKey.get(name)
+            if item is None:
+                raise NexTRuntimeError("Unable to locate subConfig")
             self.activeApp = name
-            index = parent.row()
-            self.dataChanged.emit(index, index, [Qt.FontRole])
+            self.activeAppItem = item
+            if self._resetDepth == 0:
+                index = self.indexOfItem(item)
+                self.dataChanged.emit(index, index, [Qt.FontRole])
+
+    @Slot(str)
+    def onGraphNodeAdded(self, node):
+        """
+        Slot connected to the nodeAdded signal of the subConfigs' graphs.
+
+        :param node: the node name
+        :return:
+        """
+        self.nodeAdded(self.sender().getSubConfig(), node)
+
+    @Slot(str)
+    def onGraphNodeDeleted(self, node):
+        """
+        Slot connected to the nodeDeleted signal of the subConfigs' graphs.
+
+        :param node: the node name
+        :return:
+        """
+        self.nodeDeleted(self.sender().getSubConfig(), node)
+
+    @Slot(str, str)
+    def onGraphNodeRenamed(self, oldName, newName):
+        """
+        Slot connected to the nodeRenamed signal of the subConfigs' graphs.
+
+        :param oldName: the original name
+        :param newName: the new name
+        :return:
+        """
+        self.nodeRenamed(self.sender().getSubConfig(), oldName, newName)
 
     def nodeAdded(self, subConfig, node):
         """
@@ -363,24 +635,22 @@ class ConfigurationModel(QAbstractItemModel):
         """
         parent = self.indexOfSubConfig(subConfig)
         parentItem = parent.internalPointer()
-        self.beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
-        item = self.Item(parentItem, self.NodeContent(subConfig, node))
-        self.endInsertRows()
         mockup = subConfig.getGraph().getMockup(node)
         propColl = mockup.getPropertyCollectionImpl()
         logger.debug("register propColl: %s", propColl)
-        for pname in propColl.getAllPropertyNames():
-            self.propertyAdded(item, propColl, pname)
-        if issubclass(mockup.getPluginClass(), CompositeFilter.CompositeNode):
-            # add a variable editor
-            nodeIndex = self.index(len(parentItem.children)-1,0,parent)
-            self.beginInsertRows(nodeIndex, len(item.children), len(item.children))
-            vitem = self.Item(item, propColl.getVariables())
-            self.endInsertRows()
-            self._connectVariables(vitem)
-        propColl.propertyAdded.connect(lambda pc, name: self.propertyAdded(item, pc, name))
-        propColl.propertyRemoved.connect(lambda pc, name: self.propertyRemoved(item, pc, name))
-        propColl.propertyChanged.connect(lambda pc, name: self.propertyChanged(item, pc, name))
+        composite = issubclass(mockup.getPluginClass(), CompositeFilter.CompositeNode)
+        self._beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
+        item = self.Item(parentItem, self.NodeContent(subConfig, node, propColl, composite), node)
+        # the property items are created when the children of the node are accessed for the first time
+        item.pendingChildren = True
+        self._endInsertRows()
+        if propColl not in self._propCollItems:
+            self._connections[item] = [
+                propColl.propertyAdded.connect(self.onPropertyAdded),
+                propColl.propertyRemoved.connect(self.onPropertyRemoved),
+                propColl.propertyChanged.connect(self.onPropertyChanged),
+            ]
+        self._propCollItems[propColl] = item
 
     def nodeDeleted(self, subConfig, node):
         """
@@ -394,9 +664,11 @@ class ConfigurationModel(QAbstractItemModel):
         parent = index.parent()
         parentItem = parent.internalPointer()
         idx = index.row()
-        self.beginRemoveRows(parent, idx, idx)
-        parentItem.children = parentItem.children[:idx] + parentItem.children[idx+1:]
-        self.endRemoveRows()
+        self._propCollItems.pop(index.internalPointer().content.propertyCollection, None)
+        self._disconnectItem(index.internalPointer())
+        self._beginRemoveRows(parent, idx, idx)
+        parentItem.removeChild(idx, [node])
+        self._endRemoveRows()
 
     def nodeRenamed(self, subConfig, oldName, newName):
         """
@@ -411,7 +683,66 @@ class ConfigurationModel(QAbstractItemModel):
             index = self.indexOfNode(subConfig, oldName)
             item = index.internalPointer()
             item.content.name = newName
-            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            item.parent.childByKey[newName] = item.parent.childByKey.pop(oldName)
+            if self._resetDepth == 0:
+                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+
+    @Slot(object, str)
+    def onPropertyAdded(self, propColl, name):
+        """
+        Slot connected to the propertyAdded signal of the nodes' property collections.
+
+        :param propColl: the PropertyCollection instance
+        :param name: the name of the new property
+        :return:
+        """
+        item = self._propCollItems.get(propColl)
+        if item is not None:
+            self.propertyAdded(item, propColl, name)
+
+    @Slot(object, str)
+    def onPropertyRemoved(self, propColl, name):
+        """
+        Slot connected to the propertyRemoved signal of the nodes' property collections.
+
+        :param propColl: the PropertyCollection instance
+        :param name: the name of the removed property
+        :return:
+        """
+        item = self._propCollItems.get(propColl)
+        if item is not None:
+            self.propertyRemoved(item, propColl, name)
+
+    @Slot(object, str)
+    def onPropertyChanged(self, propColl, name):
+        """
+        Slot connected to the propertyChanged signal of the nodes' property collections.
+
+        :param propColl: the PropertyCollection instance
+        :param name: the name of the changed property
+        :return:
+        """
+        item = self._propCollItems.get(propColl)
+        if item is not None:
+            self.propertyChanged(item, propColl, name)
+
+    def _populateNode(self, item):
+        """
+        Creates the children of a node item (the properties and the variable editor of composite nodes). This is
+        deferred until the children are accessed, so that no items are created for nodes which are never expanded.
+        Views haven't seen the children before, so no notifications are needed.
+
+        :param item: a NodeItem instance
+        :return:
+        """
+        item.pendingChildren = False
+        content = item.content
+        propColl = content.propertyCollection
+        for pname in propColl.getAllPropertyNames():
+            self.Item(item, self.PropertyContent(pname, propColl), pname)
+        if content.composite:
+            # add a variable editor
+            self._connectVariables(self.Item(item, propColl.getVariables()))
 
     def propertyAdded(self, parentItem, propColl, name):
         """
@@ -422,10 +753,19 @@ class ConfigurationModel(QAbstractItemModel):
         :param name: the name of the new property.
         :return:
         """
-        parent = self.indexOfNode(parentItem.content.subConfig, parentItem.content.name)
-        self.beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
-        self.Item(parentItem, self.PropertyContent(name, propColl))
-        self.endInsertRows()
+        parent = self.indexOfItem(parentItem)
+        if parentItem.pendingChildren:
+            # the children are created later anyway, but a node which had no children gets its first one
+            if not parentItem.content.composite and propColl.getAllPropertyNames() == [name]:
+                # beginInsertRows(...) queries rowCount(...), which must not populate the node before the insertion
+                parentItem.pendingChildren = False
+                self._beginInsertRows(parent, 0, 0)
+                self._populateNode(parentItem)
+                self._endInsertRows()
+            return
+        self._beginInsertRows(parent, len(parentItem.children), len(parentItem.children))
+        self.Item(parentItem, self.PropertyContent(name, propColl), name)
+        self._endInsertRows()
 
     def indexOfProperty(self, nodeItem, propName):
         """
@@ -435,12 +775,10 @@ class ConfigurationModel(QAbstractItemModel):
         :param propName: a property name
         :return: a QModelIndex instance
         """
-        idx = [idx for idx in range(len(nodeItem.children)) if nodeItem.children[idx].content.name == propName]
-        if len(idx) != 1:
+        item = nodeItem.childByKey.get(propName)
+        if item is None:
             raise NexTRuntimeError("Property item not found.")
-        idx = idx[0]
-        parent = self.indexOfNode(nodeItem.content.subConfig, nodeItem.content.name)
-        return self.index(idx, 0, parent)
+        return self.indexOfItem(item)
 
     def propertyRemoved(self, parentItem, propColl, name): # pylint: disable=unused-argument
         """
@@ -451,22 +789,66 @@ class ConfigurationModel(QAbstractItemModel):
         :param name: the name of the removed property
         :return:
         """
+        if parentItem.pendingChildren:
+            return
         index = self.indexOfProperty(parentItem, name)
-        self.beginRemoveRows(index.parent(), index.row(), index.row())
-        parentItem.children = parentItem.children[:index.row()] + parentItem.children[index.row()+1:]
-        self.endRemoveRows()
+        self._pendingPropertyChanges.pop(index.internalPointer(), None)
+        self._beginRemoveRows(index.parent(), index.row(), index.row())
+        parentItem.removeChild(index.row(), [name])
+        self._endRemoveRows()
 
     def propertyChanged(self, item, propColl, name):
         """
         Slot called when a property has been changed.
 
-        :param item: a PropertyItem instance
+        :param item: a NodeItem instance
         :param propColl: a PropertyCollection instance
         :param name: the name of the changed property
         :return:
         """
-        index = self.indexOfProperty(item, name)
-        self.setData(index, propColl.getProperty(name), Qt.DisplayRole)
+        if item.pendingChildren:
+            return
+        propItem = item.childByKey.get(name)
+        if propItem is None:
+            raise NexTRuntimeError("Property item not found.")
+        content = propItem.content
+        lastView = content.lastView
+        content.lastView = None
+        view = content.view()
+        if view == lastView:
+            return
+        if self._resetDepth == 0:
+            # the property value is in column 1, the indirect flag in column 2 only needs an update if it changed
+            lastColumn = 1 if lastView is not None and lastView[1] == view[1] else 2
+            # many properties are often changed at once (e.g. when loading presets), so the views are notified
+            # from the event loop with one signal per range of changed rows
+            self._pendingPropertyChanges[propItem] = max(lastColumn, self._pendingPropertyChanges.get(propItem, 1))
+            if not self._propertyChangeTimer.isActive():
+                self._propertyChangeTimer.start()
+
+    @Slot()
+    def _emitPropertyChanges(self):
+        """
+        Emits dataChanged for the property changes collected in propertyChanged(...), one signal per range of
+        consecutive rows.
+
+        :return:
+        """
+        pending = self._pendingPropertyChanges
+        self._pendingPropertyChanges = {}
+        rowsByNode = {}
+        for propItem, lastColumn in pending.items():
+            rowsByNode.setdefault(propItem.parent, []).append((propItem.row(), lastColumn))
+        for nodeItem, rows in rowsByNode.items():
+            rows.sort()
+            first = 0
+            for i in range(1, len(rows) + 1):
+                if i == len(rows) or rows[i][0] != rows[i-1][0] + 1:
+                    lastColumn = max(c for _, c in rows[first:i])
+                    self.dataChanged.emit(self.indexOfItem(nodeItem.children[rows[first][0]], 1),
+                                          self.indexOfItem(nodeItem.children[rows[i-1][0]], lastColumn),
+                                          [Qt.DisplayRole, Qt.EditRole])
+                    first = i
 
     def index(self, row, column, parent=QModelIndex()):
         """
@@ -518,8 +900,23 @@ class ConfigurationModel(QAbstractItemModel):
             parentItem = self.root
         else:
             parentItem = parent.internalPointer()
+            if parentItem.pendingChildren:
+                self._populateNode(parentItem)
         return len(parentItem.children)
 
+    def hasChildren(self, parent=QModelIndex()):
+        """
+        Returns whether the given model index has children. Overwritten to avoid creating the children of nodes.
+
+        :param parent: a QModelIndex instance
+        :return: bool
+        """
+        if parent.isValid() and parent.column() == 0:
+            item = parent.internalPointer()
+            if item.pendingChildren:
+                return item.content.composite or len(item.content.propertyCollection.getAllPropertyNames()) > 0
+        return super().hasChildren(parent)
+
     def columnCount(self, parent):
         """
         Returns the number of columns of the given model index
@@ -528,12 +925,7 @@ class ConfigurationModel(QAbstractItemModel):
         :return:
         """
         if parent.isValid():
-            parentItem = parent.internalPointer()
-            if isinstance(parentItem.content, self.NodeContent):
-                return 3 # nodes children have the editable properties with name, value and indirect
-            if isinstance(parentItem.content, Variables):
-                return 2
-            return 1
+            return parent.internalPointer().childColumnCount
         return 3
 
     def headerData(self, section, orientation, role):
@@ -544,7 +936,7 @@ class ConfigurationModel(QAbstractItemModel):
             return ["Name", "Property", "Indirect"][section]
         return super().headerData(section, orientation, role)
 
-    def data(self, index, role): # pylint: disable=too-many-return-statements,too-many-branches
+    def data(self, index, role):
         """
         Generic data query
 
@@ -552,89 +944,145 @@ class ConfigurationModel(QAbstractItemModel):
         :param role: the data role (see QAbstractItemModel)
         :return:
         """
-        if not index.isValid():
+        if role not in self._HANDLED_ROLES or not index.isValid():
             return None
         item = index.internalPointer().content
+        if role == ITEM_ROLE:
+            return item
+        handler = self._dataHandlers.get(type(item))
+        if handler is None:
+            if role in (Qt.DisplayRole, Qt.DecorationRole):
+                logger.warning("Unknown item %s", repr(item))
+            return None
+        return handler(item, index, role)
+
+    def _dataGroup(self, item, index, role):
+        """
+        data(...) implementation for the top-level group items.
+
+        :param item: the item's content (a string)
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if index.column() != 0:
+            return None
         if role == Qt.DisplayRole:
-            if isinstance(item, str):
-                return item if index.column() == 0 else None
-            if isinstance(item, self.SubConfigContent):
-                return item.subConfig.getName()  if index.column() == 0 else None
-            if isinstance(item, self.NodeContent):
-                return item.name  if index.column() == 0 else None
-            if isinstance(item, self.PropertyContent):
-                p = item.property.getPropertyDetails(item.name)
-                if index.column() == 0:
-                    return item.name
-                if index.column() == 1:
-                    if not p.useEnvironment:
-                        return p.handler.toViewValue(item.property.getProperty(item.name))
-                    return item.property.getProperty(item.name, subst=False)
-                return p.useEnvironment
-            if isinstance(item, Variables):
-                if index.column() == 0:
-                    return "variables"
-                return None
-            if isinstance(item, self.VariableContent):
-                if index.column() == 0:
-                    return item.name
-                try:
-                    value = item.variables.getraw(item.name)
-                    return value
-                except KeyError:
-                    # this might happen when a variable is already deleted and the model updates itself
-                    return ""
-            logger.warning("Unknown item %s", repr(item))
+            return item
+        if role == Qt.DecorationRole and not index.parent().isValid():
+            return self._decorations()["harddisk"]
+        return None
+
+    def _dataSubConfig(self, item, index, role):
+        """
+        data(...) implementation for SubConfigContent items.
+
+        :param item: a SubConfigContent instance
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if index.column() != 0:
+            return None
+        if role == Qt.DisplayRole:
+            return item.subConfig.getName()
+        if role == Qt.DecorationRole:
+            if item.icon is None:
+                composite = item.configType == Configuration.CONFIG_TYPE_COMPOSITE
+                item.icon = self._decorations()["composite" if composite else "application"]
+            return item.icon
+        if role == Qt.FontRole:
+            # only the active application is displayed with a different font
+            if index.internalPointer() is self.activeAppItem:
+                return self._activeAppFont()
+        return None
+
+    def _dataNode(self, item, index, role):
+        """
+        data(...) implementation for NodeContent items.
+
+        :param item: a NodeContent instance
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if index.column() != 0:
+            return None
+        if role == Qt.DisplayRole:
+            return item.name
+        if role == Qt.DecorationRole:
+            return self._decorations()["node"]
+        return None
+
+    @staticmethod
+    def _dataProperty(item, index, role): # pylint: disable=too-many-return-statements
+        """
+        data(...) implementation for PropertyContent items.
+
+        :param item: a PropertyContent instance
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return item.name
+            return item.view()[index.column() - 1]
         if role == Qt.CheckStateRole:
-            if isinstance(item, self.PropertyContent) and index.column() == 2:
-                p = item.property.getPropertyDetails(item.name)
-                if p.useEnvironment:
+            if index.column() == 2:
+                if item.view()[1]:
                     return Qt.Checked
                 return Qt.Unchecked
+        if role == Qt.ToolTipRole:
+            value, useEnvironment = item.view()
+            if index.column() == 0 or (index.column() == 1 and not useEnvironment):
+                return item.details.helpstr
+            if index.column() == 1:
+                return f"{value}={item.property.getProperty(item.name)}"
+            return "If enabled, this property is evaluated using variable substitution."
+        return None
+
+    def _dataVariables(self, item, index, role): # pylint: disable=unused-argument
+        """
+        data(...) implementation for Variables items.
+
+        :param item: a Variables instance
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if index.column() != 0:
+            return None
+        if role == Qt.DisplayRole:
+            return "variables"
         if role == Qt.DecorationRole:
-            if index.column() != 0:
-                return None
-            if isinstance(item, str):
-                if not index.parent().isValid():
-                    return QIcon.fromTheme("drive-harddisk", QApplication.style().standardIcon(QStyle.SP_DriveHDIcon))
-            if isinstance(item, self.SubConfigContent):
-                if Configuration.configType(item.subConfig) == Configuration.CONFIG_TYPE_COMPOSITE:
-                    return QIcon.fromTheme("repository", QApplication.style().standardIcon(QStyle.SP_DirLinkIcon))
-                if Configuration.configType(item.subConfig) == Configuration.CONFIG_TYPE_APPLICATION:
-                    return QIcon.fromTheme("folder", QApplication.style().standardIcon(QStyle.SP_DirIcon))
-            if isinstance(item, self.NodeContent):
-                return QIcon.fromTheme("unknown", QApplication.style().standardIcon(QStyle.SP_FileIcon))
-            if isinstance(item, self.PropertyContent):
-                return None
-            if isinstance(item, Variables):
-                return QIcon.fromTheme("unknown", QApplication.style().standardIcon(QStyle.SP_DirIcon))
-            if isinstance(item, self.VariableContent):
-                return None
-            logger.warning("Unknown item %s", repr(item))
-        if role == Qt.FontRole:
-            if index.column() != 0:
-                return None
-            if isinstance(item, self.SubConfigContent):
-                if index.parent().row() == 1:
-                    font = QFont()
-                    if item.subConfig.getName() == self.activeApp:
-                        font.setBold(True)
-                        return font
+            return self._decorations()["variables"]
+        return None
+
+    @staticmethod
+    def _dataVariable(item, index, role):
+        """
+        data(...) implementation for VariableContent items.
+
+        :param item: a VariableContent instance
+        :param index: a QModelIndex instance
+        :param role: the data role
+        :return:
+        """
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return item.name
+            try:
+                value = item.variables.getraw(item.name)
+                return value
+            except KeyError:
+                # this might happen when a variable is already deleted and the model updates itself
+                return ""
         if role == Qt.ToolTipRole:
-            if isinstance(item, self.PropertyContent):
-                p = item.property.getPropertyDetails(item.name)
-                if index.column() == 0 or (index.column() == 1 and not p.useEnvironment):
-                    return p.helpstr
-                if index.column() == 1:
-                    return f"{item.property.getProperty(item.name, subst=False)}={item.property.getProperty(item.name)}"
-                return "If enabled, this property is evaluated using variable substitution."
-            if isinstance(item, self.VariableContent):
-                return item.variables.subst(f"{item.name} = ${item.name}")
-        if role == ITEM_ROLE:
-            return item
+            return item.variables.subst(f"{item.name} = ${item.name}")
         return None
 
-    def flags(self, index): # pylint: disable=too-many-return-statements,too-many-branches
+    def flags(self, index):
         """
         Returns teh item flags of the given index
 
@@ -644,29 +1092,66 @@ class ConfigurationModel(QAbstractItemModel):
         if not index.isValid():
             return Qt.NoItemFlags
         item = index.internalPointer().content
-        if isinstance(item, str):
+        handler = self._flagsHandlers.get(type(item))
+        if handler is None:
             return Qt.ItemIsEnabled
-        if isinstance(item, self.SubConfigContent):
-            if isinstance(item.subConfig, CompositeFilter):
-                return Qt.ItemIsEnabled | Qt.ItemIsEditable | Qt.ItemIsDragEnabled
+        return handler(item, index)
+
+    @staticmethod
+    def _flagsSubConfig(item, index): # pylint: disable=unused-argument
+        """
+        flags(...) implementation for SubConfigContent items.
+
+        :param item: a SubConfigContent instance
+        :param index: a QModelIndex instance
+        :return:
+        """
+        if item.configType == Configuration.CONFIG_TYPE_COMPOSITE:
+            return Qt.ItemIsEnabled | Qt.ItemIsEditable | Qt.ItemIsDragEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    @staticmethod
+    def _flagsNode(item, index): # pylint: disable=unused-argument
+        """
+        flags(...) implementation for NodeContent items.
+
+        :param item: a NodeContent instance
+        :param index: a QModelIndex instance
+        :return:
+        """
+        return Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    @staticmethod
+    def _flagsProperty(item, index): # pylint: disable=unused-argument
+        """
+        flags(...) implementation for PropertyContent items.
+
+        :param item: a PropertyContent instance
+        :param index: a QModelIndex instance
+        :return:
+        """
+        if index.column() == 1:
             return Qt.ItemIsEnabled | Qt.ItemIsEditable
-        if isinstance(item, self.NodeContent):
+        if index.column() == 2:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled
+
+    @staticmethod
+    def _flagsVariable(item, index):
+        """
+        flags(...) implementation for VariableContent items.
+
+        :param item: a VariableContent instance
+        :param index: a QModelIndex instance
+        :return:
+        """
+        if item.variables.isReadonly(item.name):
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 1:
             return Qt.ItemIsEnabled | Qt.ItemIsEditable
-        if isinstance(item, self.PropertyContent):
-            if index.column() == 0:
-                return Qt.ItemIsEnabled
-            if index.column() == 1:
-                return Qt.ItemIsEnabled | Qt.ItemIsEditable
-            if index.column() == 2:
-                return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
-        if isinstance(item, self.VariableContent):
-            if item.variables.isReadonly(item.name):
-                return Qt.ItemFlag.NoItemFlags
-            if index.column() == 1:
-                return Qt.ItemIsEnabled | Qt.ItemIsEditable
         return Qt.ItemIsEnabled
 
-    def setData(self, index, value, role):# pylint: disable=too-many-return-statements,too-many-branches,unused-argument
+    def setData(self, index, value, role):
         """
         Generic data modification (see QAbstractItemModel for details)
 
@@ -678,90 +1163,138 @@ class ConfigurationModel(QAbstractItemModel):
         if not index.isValid():
             return False
         item = index.internalPointer().content
-        if isinstance(item, str):
+        handler = self._setDataHandlers.get(type(item))
+        if handler is None:
             return False
-        if isinstance(item, self.SubConfigContent):
-            subConfig = item.subConfig
-            if value == subConfig.getName():
-                return False
-            config = self.root.content
-            if Configuration.configType(subConfig) == Configuration.CONFIG_TYPE_APPLICATION:
-                try:
-                    if subConfig.getName() == self.activeApp:
-                        self.activeApp = value
-                    config.renameApp(subConfig.getName(), value)
-                except NexTRuntimeError:
-                    return False
-                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
-                return True
-            if Configuration.configType(subConfig) == Configuration.CONFIG_TYPE_COMPOSITE:
-                try:
-                    config.renameComposite(subConfig.getName(), value)
-                except NexTRuntimeError:
-                    return False
-                self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
-                return True
-        if isinstance(item, self.NodeContent):
-            if item.name == value:
-                return False
-            subConfig = index.parent().internalPointer().content.subConfig
-            graph = subConfig.getGraph()
+        return handler(item, index, value, role)
+
+    def _setDataSubConfig(self, item, index, value, role): # pylint: disable=unused-argument
+        """
+        setData(...) implementation for SubConfigContent items.
+
+        :param item: a SubConfigContent instance
+        :param index: a QModelIndex instance
+        :param value: the new value
+        :param role: the role to be changed
+        :return:
+        """
+        subConfig = item.subConfig
+        if value == subConfig.getName():
+            return False
+        config = self.root.content
+        if item.configType == Configuration.CONFIG_TYPE_APPLICATION:
             try:
-                graph.renameNode(item.name, value)
+                if subConfig.getName() == self.activeApp:
+                    self.activeApp = value
+                config.renameApp(subConfig.getName(), value)
             except NexTRuntimeError:
                 return False
             self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
             return True
-        if isinstance(item, self.PropertyContent):
-            if index.column() == 1:
-                if item.property.getPropertyDetails(item.name).useEnvironment:
-                    item.property.setVarProperty(item.name, value)
-                else:
-                    try:
-                        item.property.setProperty(item.name, value)
-                    except NexTRuntimeError:
-                        return False
-            elif index.column() == 2:
-                p = item.property.getPropertyDetails(item.name)
-                if role == Qt.CheckStateRole:
-                    value = not Qt.CheckState(value) == Qt.Unchecked
-                if value and not p.useEnvironment:
-                    item.property.setVarProperty(item.name, str(item.property.getProperty(item.name)))
-                elif not value and p.useEnvironment:
-                    item.property.setProperty(item.name, item.property.getProperty(item.name))
-                return False
-            i0 = self.index(index.row(), 1, index.parent())
-            i1 = self.index(index.row(), 2, index.parent())
-            self.dataChanged.emit(i0, i1, [Qt.DisplayRole, Qt.EditRole])
-            return True
-        if isinstance(item, self.VariableContent):
+        if item.configType == Configuration.CONFIG_TYPE_COMPOSITE:
             try:
-                item.variables[item.name] = value
+                config.renameComposite(subConfig.getName(), value)
             except NexTRuntimeError:
                 return False
             self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
             return True
         return False
 
+    def _setDataNode(self, item, index, value, role): # pylint: disable=unused-argument
+        """
+        setData(...) implementation for NodeContent items.
+
+        :param item: a NodeContent instance
+        :param index: a QModelIndex instance
+        :param value: the new value
+        :param role: the role to be changed
+        :return:
+        """
+        if item.name == value:
+            return False
+        subConfig = index.parent().internalPointer().content.subConfig
+        graph = subConfig.getGraph()
+        try:
+            graph.renameNode(item.name, value)
+        except NexTRuntimeError:
+            return False
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def _setDataProperty(self, item, index, value, role):
+        """
+        setData(...) implementation for PropertyContent items.
+
+        :param item: a PropertyContent instance
+        :param index: a QModelIndex instance
+        :param value: the new value
+        :param role: the role to be changed
+        :return:
+        """
+        if index.column() == 1:
+            before = item.property.getRawProperty(item.name)
+            if before[1]:
+                item.property.setVarProperty(item.name, value)
+            else:
+                try:
+                    item.property.setProperty(item.name, value)
+                except NexTRuntimeError:
+                    return False
+            if item.property.getRawProperty(item.name) == before:
+                # the value is unchanged, no need to update the views
+                return True
+        elif index.column() == 2:
+            _, useEnvironment = item.property.getRawProperty(item.name)
+            if role == Qt.CheckStateRole:
+                # views pass either the integer check state or the Qt.CheckState enum, which is not an int in
+                # PySide6
+                value = value not in (0, Qt.Unchecked)
+            if value and not useEnvironment:
+                item.property.setVarProperty(item.name, str(item.property.getProperty(item.name)))
+            elif not value and useEnvironment:
+                item.property.setProperty(item.name, item.property.getProperty(item.name))
+            return False
+        i0 = self.index(index.row(), 1, index.parent())
+        i1 = self.index(index.row(), 2, index.parent())
+        # the change has been reported already
+        self._pendingPropertyChanges.pop(index.internalPointer(), None)
+        self.dataChanged.emit(i0, i1, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def _setDataVariable(self, item, index, value, role): # pylint: disable=unused-argument
+        """
+        setData(...) implementation for VariableContent items.
+
+        :param item: a VariableContent instance
+        :param index: a QModelIndex instance
+        :param value: the new value
+        :param role: the role to be changed
+        :return:
+        """
+        try:
+            item.variables[item.name] = value
+        except NexTRuntimeError:
+            return False
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
     def mimeTypes(self):
         """
         Overwritten from QAbstractItemModel, provide a mime type for copy/pasting
         """
-        logger.debug("mimeTypes")
-        return ["application/x-nexxT-compositefilter"]
+        return [_COMPOSITE_MIME_TYPE]
 
     def mimeData(self, indices):
         """
         Overwritten from QAbstractItemModel, provide the mime data for copy/pasting (note that this doesn't work across
         processes.
         """
-        logger.debug("mimeData")
         if len(indices) == 1 and indices[0].isValid():
             index = indices[0]
             item = index.internalPointer().content
-            if isinstance(item, self.SubConfigContent) and isinstance(item.subConfig, CompositeFilter):
+            if isinstance(item, self.SubConfigContent) and item.configType == Configuration.CONFIG_TYPE_COMPOSITE:
                 res = QMimeData()
-                res.setData(self.mimeTypes()[0], item.subConfig.getName().encode("utf8"))
+                res.setData(_COMPOSITE_MIME_TYPE, item.subConfig.getName().encode("utf8"))
                 return res
         return None
 
@@ -870,8 +1403,9 @@ class MVCConfigurationBase(QObject):
             return
         oldDirty = self._configuration.dirty()
         state = self._configuration.save()
-        self._configuration.close(avoidSave=True)
-        self._configuration.load(state)
+        with self.model.modelReset():
+            self._configuration.close(avoidSave=True)
+            self._configuration.load(state)
         self._configuration.setDirty(oldDirty)
         if self._reloadToState is not None:
             self._configuration.activate(self._reloadToState["name"])
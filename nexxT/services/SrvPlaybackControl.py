@@ -8,16 +8,26 @@
 This module provides the playback control console service for the nexxT framework.
 """
 
-import pathlib
+import fnmatch
+import os.path
 import logging
-from nexxT.Qt.QtCore import QObject, Signal, Slot, Qt, QDir, QMutex, QMutexLocker
+import re
+from collections import Counter
+from nexxT.Qt.QtCore import QObject, Signal, Slot, Qt, QMutex, QMutexLocker
 from nexxT.interface import FilterState
 from nexxT.core.Exceptions import NexTRuntimeError
 from nexxT.core.Application import Application
-from nexxT.core.Utils import assertMainThread, MethodInvoker, handleException, mainThread
+from nexxT.core.Utils import assertMainThread, isMainThread, MethodInvoker, handleException, mainThread
 
 logger = logging.getLogger(__name__)
 
+# optional features connected from the control to a playback device, given as (slot name, private signal name)
+_CONTROL_FEATURES = tuple((f, "_" + f) for f in ["stepForward", "stepBackward", "seekTime", "seekBeginning",
+                                                  "seekEnd", "setTimeFactor", "setSequence"])
+# optional features connected from a playback device to the control, given as (signal name, private slot name)
+_DEVICE_FEATURES = tuple((f, "_" + f) for f in ["sequenceOpened", "currentTimestampChanged", "playbackStarted",
+                                                 "playbackPaused", "timeRatioChanged"])
+
 class PlaybackDeviceProxy(QObject):
     """
     This class acts as a proxy and is connected to exactly one playback device over QT signals slots for providing
@@ -28,6 +38,10 @@ class PlaybackDeviceProxy(QObject):
         # private variables
         self._playbackControl = playbackControl
         self._nameFilters = nameFilters
+        # the name filters don't change, so they are translated once into a single (case insensitive, like
+        # QDir.match) regular expression; an empty list doesn't match anything
+        self._nameFilterRe = (re.compile("|".join(fnmatch.translate(f) for f in nameFilters), re.IGNORECASE)
+                              if len(nameFilters) > 0 else None)
         self._controlsFile = False # is set to True when setSequence is called with a matching file name
         self._featureSet = {}
         # this instance is called in the playbackDevice's thread, move it to the playbackControl thread (= main thread)
@@ -39,16 +53,14 @@ class PlaybackDeviceProxy(QObject):
             raise NexTRuntimeError("cannot connect to slot pausePlayback()")
         # setup optional connections from control to playback
         self._featureSet = set(["startPlayback", "pausePlayback"])
-        for feature in ["stepForward", "stepBackward", "seekTime", "seekBeginning", "seekEnd",
-                        "setTimeFactor", "setSequence"]:
-            signal = getattr(self, "_" + feature)
+        for feature, signalName in _CONTROL_FEATURES:
+            signal = getattr(self, signalName)
             slot = getattr(playbackDevice, feature, None)
             if slot is not None and signal.connect(slot):
                 self._featureSet.add(feature)
         # setup optional connections from playback to control
-        for feature in ["sequenceOpened", "currentTimestampChanged", "playbackStarted", "playbackPaused",
-                        "timeRatioChanged"]:
-            slot = getattr(self, "_" + feature)
+        for feature, slotName in _DEVICE_FEATURES:
+            slot = getattr(self, slotName)
             signal = getattr(playbackDevice, feature, None)
             if signal is not None and signal.connect(slot):
                 self._featureSet.add(feature)
@@ -110,7 +122,8 @@ class PlaybackDeviceProxy(QObject):
 
         :param filename: a string instance or None
         """
-        if filename is not None and not QDir.match(self._nameFilters, pathlib.Path(filename).name):
+        if filename is not None and (self._nameFilterRe is None or
+                                     self._nameFilterRe.match(os.path.basename(filename)) is None):
             filename = None
         self._controlsFile = filename is not None
         self._setSequence.emit(filename)
@@ -194,10 +207,28 @@ class MVCPlaybackControlBase(QObject):
 
     def __init__(self):
         super().__init__()
-        self._deviceId = 0
+        # playback device -> dict(object, featureset, nameFilters, proxy)
         self._registeredDevices = {}
+        # number of registered devices supporting a feature / name filter
+        self._featureCount = Counter()
+        self._nameFilterCount = Counter()
+        # the feature set and name filters reported by the last _supportedFeaturesChanged(...) call
+        self._lastFeatureset = frozenset()
+        self._lastNameFilters = frozenset()
         self._mutex = QMutex()
         self._setSequence.connect(self._stopSetSequenceStart)
+        # the control signals are connected once and dispatched to the proxies of all registered devices
+        # (setSequence is forwarded explicitly in _stopSetSequenceStart)
+        self._startPlayback.connect(self._routeStartPlayback)
+        self._pausePlayback.connect(self._routePausePlayback)
+        self._stepForward.connect(self._routeStepForward)
+        self._stepBackward.connect(self._routeStepBackward)
+        self._seekBeginning.connect(self._routeSeekBeginning)
+        self._seekEnd.connect(self._routeSeekEnd)
+        self._seekTime.connect(self._routeSeekTime)
+        self._setTimeFactor.connect(self._routeSetTimeFactor)
+        # the slots connected to each proxy, given as (proxy signal name, slot)
+        self._proxySlots = [(feature, getattr(self, slotName)) for feature, slotName in _DEVICE_FEATURES]
 
     @Slot(QObject, "QStringList")
     def setupConnections(self, playbackDevice, nameFilters):
@@ -232,33 +263,22 @@ class MVCPlaybackControlBase(QObject):
         :return:
         """
         with QMutexLocker(self._mutex):
-            for _, dev in self._registeredDevices.items():
-                if dev["object"] is playbackDevice:
-                    raise NexTRuntimeError("Trying to register a playbackDevice object twice.")
+            if playbackDevice in self._registeredDevices:
+                raise NexTRuntimeError("Trying to register a playbackDevice object twice.")
 
             proxy = PlaybackDeviceProxy(self, playbackDevice, nameFilters)
             featureset = proxy.featureSet()
 
-            for feature in ["stepForward", "stepBackward", "seekTime", "seekBeginning", "seekEnd",
-                            "setTimeFactor", "startPlayback", "pausePlayback"]:
-                signal = getattr(self, "_" + feature)
-                slot = getattr(proxy, feature, None)
-                if slot is not None:
-                    signal.connect(slot)
-
-            for feature in ["sequenceOpened", "currentTimestampChanged", "playbackStarted", "playbackPaused",
-                            "timeRatioChanged"]:
-                slot = getattr(self, "_" + feature)
-                signal = getattr(proxy, feature, None)
-                if signal is not None:
-                    signal.connect(slot, Qt.UniqueConnection)
-
-            self._registeredDevices[self._deviceId] = dict(object=playbackDevice,
+            for feature, slot in self._proxySlots:
+                getattr(proxy, feature).connect(slot, Qt.UniqueConnection)
+
+            self._registeredDevices[playbackDevice] = dict(object=playbackDevice,
                                                            featureset=featureset,
                                                            nameFilters=nameFilters,
                                                            proxy=proxy)
-            self._deviceId += 1
-            MethodInvoker(dict(object=self, method="_updateFeatureSet", thread=mainThread()), Qt.QueuedConnection)
+            self._featureCount.update(featureset)
+            self._nameFilterCount.update(set(nameFilters))
+        self._requestFeatureSetUpdate()
 
     @Slot(QObject)
     def removeConnections(self, playbackDevice):
@@ -272,17 +292,14 @@ class MVCPlaybackControlBase(QObject):
         with QMutexLocker(self._mutex):
             # note: avoid signal/slot connections/disconnections while holding the mutex since this might lead to
             # deadlocks
-            found = []
-            for devid, dev in self._registeredDevices.items():
-                if dev["object"] is playbackDevice:
-                    found.append((devid, dev))
-            if len(found) > 0:
-                for devid, _ in found:
-                    del self._registeredDevices[devid]
-        del found
+            dev = self._registeredDevices.pop(playbackDevice, None)
+            if dev is not None:
+                self._uncount(self._featureCount, dev["featureset"])
+                self._uncount(self._nameFilterCount, set(dev["nameFilters"]))
+        del dev
         logger.debug("disconnected connections of playback device. number of devices left: %d",
                      len(self._registeredDevices))
-        MethodInvoker(dict(object=self, method="_updateFeatureSet", thread=mainThread()), Qt.QueuedConnection)
+        self._requestFeatureSetUpdate()
 
     @handleException
     def _stopSetSequenceStart(self, filename):
@@ -305,7 +322,7 @@ class MVCPlaybackControlBase(QObject):
         if state == FilterState.ACTIVE:
             Application.activeApplication.stop()
         assert Application.activeApplication.getState() == FilterState.OPENED
-        for _, spec in self._registeredDevices.items():
+        for spec in self._registeredDevices.values():
             spec["proxy"].setSequence(filename)
             # only one filter will get the playback control
             if spec["proxy"].hasControl():
@@ -316,22 +333,77 @@ class MVCPlaybackControlBase(QObject):
         Application.activeApplication.start()
         assert Application.activeApplication.getState() == FilterState.ACTIVE
 
+    def _routeToProxies(self, feature, *args):
+        assertMainThread()
+        with QMutexLocker(self._mutex):
+            proxies = [spec["proxy"] for spec in self._registeredDevices.values()]
+        for proxy in proxies:
+            getattr(proxy, feature)(*args)
+
+    @Slot()
+    def _routeStartPlayback(self):
+        self._routeToProxies("startPlayback")
+
+    @Slot()
+    def _routePausePlayback(self):
+        self._routeToProxies("pausePlayback")
+
+    @Slot(str)
+    def _routeStepForward(self, stream):
+        self._routeToProxies("stepForward", stream)
+
+    @Slot(str)
+    def _routeStepBackward(self, stream):
+        self._routeToProxies("stepBackward", stream)
+
+    @Slot()
+    def _routeSeekBeginning(self):
+        self._routeToProxies("seekBeginning")
+
+    @Slot()
+    def _routeSeekEnd(self):
+        self._routeToProxies("seekEnd")
+
+    @Slot('qint64')
+    def _routeSeekTime(self, timestampNS):
+        self._routeToProxies("seekTime", timestampNS)
+
+    @Slot(float)
+    def _routeSetTimeFactor(self, factor):
+        self._routeToProxies("setTimeFactor", factor)
+
+    @staticmethod
+    def _uncount(counter, keys):
+        for k in keys:
+            counter[k] -= 1
+            if counter[k] <= 0:
+                del counter[k]
+
+    def _requestFeatureSetUpdate(self):
+        # the feature set is reported in the main thread, calls from other threads are queued
+        if isMainThread():
+            self._updateFeatureSet()
+        else:
+            MethodInvoker(dict(object=self, method="_updateFeatureSet", thread=mainThread()), Qt.QueuedConnection)
+
     def _updateFeatureSet(self):
         assertMainThread()
-        featureset = set()
-        nameFilters = set()
-        for _, dev in self._registeredDevices.items():
-            featureset = featureset.union(dev["featureset"])
-            nameFilters = nameFilters.union(dev["nameFilters"])
+        with QMutexLocker(self._mutex):
+            featureset = frozenset(self._featureCount)
+            nameFilters = frozenset(self._nameFilterCount)
+        if featureset == self._lastFeatureset and nameFilters == self._lastNameFilters:
+            return
+        self._lastFeatureset = featureset
+        self._lastNameFilters = nameFilters
         self._supportedFeaturesChanged(featureset, nameFilters)
 
     def _supportedFeaturesChanged(self, featureset, nameFilters):
         """
         Can be overriden to get the supported features of the connected playbackDevice(s). This function is called
-        from multiple threads, but not at the same time.
+        in the main thread only, possibly synchronously from setupConnections(...) or removeConnections(...).
 
-        :param featureset set of supported features
-        :param nameFilters set of supported nameFilters
+        :param featureset frozenset of supported features
+        :param nameFilters frozenset of supported nameFilters
         :return:
         """
 
@@ -381,6 +453,7 @@ class PlaybackControlConsole(MVCPlaybackControlBase):
     Console service for playback control. Basically inverts the signals and slots and provides an API for scripting.
     The GUI service inherits from this class, so that the GUI can also be scripted in the same way.
     """
+    # the feature set and the name filters are delivered as frozensets
     supportedFeaturesChanged = Signal(object, object)
     sequenceOpened = Signal(str, 'qint64', 'qint64', object)
     currentTimestampChanged = Signal('qint64')
@@ -480,10 +553,10 @@ class PlaybackControlConsole(MVCPlaybackControlBase):
     def _supportedFeaturesChanged(self, featureset, nameFilters):
         """
         Can be overriden to get the supported features of the connected playbackDevice(s). This function is called
-        from multiple threads, but not at the same time.
+        in the main thread only, possibly synchronously from setupConnections(...) or removeConnections(...).
 
-        :param featureset set of supported features
-        :param nameFilters set of supported nameFilters
+        :param featureset frozenset of supported features
+        :param nameFilters frozenset of supported nameFilters
         :return:
         """
         self.supportedFeaturesChanged.emit(featureset, nameFilters)
@@ -99,9 +99,9 @@ class MVCRecordingControlBase(QObject):
                     found.append(devid)
             if len(found) > 0:
                 for devid in found:
-                    for signal, slot in self._registeredDevices[devid]["connections"]:
+                    dev = self._registeredDevices.pop(devid)
+                    for signal, slot in dev["connections"]:
                         signal.disconnect(slot)
-                    del self._registeredDevices[devid]
                 logger.debug("disconnected connections of recording device. number of devices left: %d",
                              len(self._registeredDevices))
                 self._updateFeatureSet()
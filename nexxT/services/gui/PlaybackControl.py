@@ -155,7 +155,7 @@ class MVCPlaybackControlGUI(PlaybackControlConsole):
             a.triggered.connect(self.openRecent)
             recentMenu.addAction(a)
 
-        self._supportedFeaturesChanged(set(), set())
+        self._supportedFeaturesChanged(frozenset(), frozenset())
 
     def __del__(self):
         logger.internal("deleting playback control")
@@ -174,8 +174,8 @@ class MVCPlaybackControlGUI(PlaybackControlConsole):
 
     def _supportedFeaturesChanged(self, featureset, nameFilters):
         """
-        overwritten from MVCPlaybackControlBase. This function is called
-        from multiple threads, but not at the same time.
+        overwritten from MVCPlaybackControlBase. This function is called in the main thread only, possibly
+        synchronously from setupConnections(...) or removeConnections(...).
 
         :param featureset: the current featureset
         :return:
@@ -24,6 +24,8 @@ namespace nexxT
         QByteArray content;
         QString datatype;
         int64_t timestamp;
+        /* set for samples created with fromRawData */
+        std::function<void()> release;
     };
 };
 
@@ -40,11 +42,24 @@ DataSample::~DataSample()
     instanceCounter--;
     memoryHeld -= d->content.size();
     NEXXT_LOG_INTERNAL(QString("DataSample::~DataSample (numInstances=%1, memory=%2 MB)").arg(instanceCounter).arg(memoryHeld/(1024*1024)));
+    std::function<void()> release;
+    release.swap(d->release);
     delete d;
+    /* the content is released above, so the external memory is not referenced anymore */
+    if( release )
+    {
+        release();
+    }
 }
         
 QByteArray DataSample::getContent() const
 {
+    if( d->release )
+    {
+        /* the content references external memory which is released together with the sample, a detached copy is
+           returned, so that the receiver can keep it beyond the lifetime of the sample */
+        return QByteArray(d->content.constData(), d->content.size());
+    }
     return d->content;
 }
     
@@ -60,7 +75,7 @@ QString DataSample::getDatatype() const
 
 SharedDataSamplePtr DataSample::copy(const SharedDataSamplePtr &src)
 {
-    return SharedDataSamplePtr(new DataSample(src->d->content, src->d->datatype, src->d->timestamp));
+    return SharedDataSamplePtr(new DataSample(src->getContent(), src->d->datatype, src->d->timestamp));
 }
 
 SharedDataSamplePtr DataSample::make_shared(DataSample *sample)
@@ -68,9 +83,29 @@ SharedDataSamplePtr DataSample::make_shared(DataSample *sample)
     return SharedDataSamplePtr(sample);
 }
 
+SharedDataSamplePtr DataSample::make(const QByteArray &content, const QString &datatype, int64_t timestamp)
+{
+    return SharedDataSamplePtr(new DataSample(content, datatype, timestamp));
+}
+
+SharedDataSamplePtr DataSample::fromRawData(const char *data, qsizetype size, const QString &datatype,
+                                            int64_t timestamp, const std::function<void()> &release)
+{
+    DataSample *res = new DataSample(QByteArray::fromRawData(data, size), datatype, timestamp);
+    res->d->release = release;
+    return SharedDataSamplePtr(res);
+}
+
 void DataSample::registerMetaType()
 {
+    /* the registration is needed only once per process, even if nexxT.interface is initialized multiple times */
+    static std::atomic_bool registered(false);
+    if( registered.exchange(true) )
+    {
+        return;
+    }
     qRegisterMetaType<QSharedPointer<const nexxT::DataSample> >();
+    qRegisterMetaType<QList<QSharedPointer<const nexxT::DataSample> > >();
 }
 
 int64_t DataSample::currentTime()
@@ -29,6 +29,8 @@ namespace nexxT
     {
         int queueSizeSamples;
         double queueSizeSeconds;
+        /* queueSizeSeconds converted to timestamp units, computed once in setQueueSize */
+        double queueSizeTime;
         bool interthreadDynamicQueue;
         QList<SharedDataSamplePtr> queue;
         std::map<QSemaphore*, uint32_t> semaphoreN;
@@ -39,7 +41,7 @@ namespace nexxT
 
 InputPortInterface::InputPortInterface(bool dynamic, const QString &name, BaseFilterEnvironment *env, int queueSizeSamples, double queueSizeSeconds) :
     Port(dynamic, name, env),
-    d(new InputPortD{queueSizeSamples, queueSizeSeconds, false})
+    d(new InputPortD{queueSizeSamples, queueSizeSeconds, queueSizeSeconds / (double)DataSample::TIMESTAMP_RES, false})
 {
     d->srvprof = Services::getService("Profiling");
     d->profname = QString();
@@ -51,6 +53,11 @@ InputPortInterface::~InputPortInterface()
     delete d;
 }
 
+SharedPortPtr InputPortInterface::make(bool dynamic, const QString &name, BaseFilterEnvironment *environment, int queueSizeSamples, double queueSizeSeconds)
+{
+    return SharedPortPtr(new InputPortInterface(dynamic, name, environment, queueSizeSamples, queueSizeSeconds));
+}
+
 SharedDataSamplePtr InputPortInterface::getData(int delaySamples, double delaySeconds) const
 {
     if( QThread::currentThread() != thread() )
@@ -95,6 +102,7 @@ void InputPortInterface::setQueueSize(int queueSizeSamples, double queueSizeSeco
     }
     d->queueSizeSamples = queueSizeSamples;
     d->queueSizeSeconds = queueSizeSeconds;
+    d->queueSizeTime = queueSizeSeconds / (double)DataSample::TIMESTAMP_RES;
 }
 
 int InputPortInterface::queueSizeSamples()
@@ -152,8 +160,7 @@ void InputPortInterface::addToQueue(const SharedDataSamplePtr &sample)
     }
     if(d->queueSizeSeconds > 0)
     {
-        double queueSizeTime = d->queueSizeSeconds / (double)DataSample::TIMESTAMP_RES;
-        while( d->queue.size() > 0 && (double(d->queue.first()->getTimestamp() - d->queue.last()->getTimestamp()) > queueSizeTime) )
+        while( d->queue.size() > 0 && (double(d->queue.first()->getTimestamp() - d->queue.last()->getTimestamp()) > d->queueSizeTime) )
         {
             d->queue.removeLast();
         }
@@ -179,11 +186,17 @@ void InputPortInterface::transmit()
     }
 }
 
-void InputPortInterface::receiveAsync(const QSharedPointer<const DataSample> &sample, QSemaphore *semaphore, bool isPending)
+namespace
 {
     /* pending receives from the main thread are stored here to be processed later */
     typedef std::tuple<InputPortInterface*, QSharedPointer<const DataSample>, QSemaphore *> RcvArgs;
-    static std::vector<RcvArgs> pendingReceives;
+    std::vector<RcvArgs> pendingReceives;
+    /* recursion depth of processEvents calls in receiveAsync */
+    uint32_t stackDepth = 0;
+};
+
+void InputPortInterface::receiveAsync(const QSharedPointer<const DataSample> &sample, QSemaphore *semaphore, bool isPending)
+{
     try
     {
         if( QThread::currentThread() != thread() )
@@ -200,7 +213,6 @@ void InputPortInterface::receiveAsync(const QSharedPointer<const DataSample> &sa
             be safe. However, we have to take care that other receiveAsync events are still in the 
             correct order, that's why we have the buffering in pendingReceives.
             */
-            static uint32_t stackDepth = 0;
             if( stackDepth > 0 )
             {
                 /* 
@@ -298,3 +310,54 @@ void InputPortInterface::receiveSync (const QSharedPointer<const DataSample> &sa
     }
 }
 
+void InputPortInterface::receiveAsyncBatch(const QList<QSharedPointer<const DataSample> > &samples, QSemaphore *semaphore)
+{
+    if( samples.isEmpty() )
+    {
+        return;
+    }
+    if( QThread::currentThread() == QCoreApplication::instance()->thread() )
+    {
+        /* 
+        In the main thread, the samples are passed through the pendingReceives buffer, otherwise samples received
+        during the processEvents call of receiveAsync might overtake the remaining samples of this batch. The 
+        semaphore is released per sample in this case.
+        */
+        int first = (stackDepth > 0) ? 0 : 1;
+        for(int i = first; i < samples.size(); i++)
+        {
+            pendingReceives.push_back(std::make_tuple(this, samples[i], semaphore));
+        }
+        if( first > 0 )
+        {
+            receiveAsync(samples[0], semaphore);
+        }
+        return;
+    }
+    if( d->interthreadDynamicQueue && semaphore )
+    {
+        /* the semaphore accounting of the dynamic queue is done per sample */
+        for(const QSharedPointer<const DataSample> &sample : samples)
+        {
+            receiveAsync(sample, semaphore);
+        }
+        return;
+    }
+    for(const QSharedPointer<const DataSample> &sample : samples)
+    {
+        /* the semaphore is released once for the whole batch below */
+        receiveAsync(sample, 0);
+    }
+    if( semaphore )
+    {
+        semaphore->release(samples.size());
+    }
+}
+
+void InputPortInterface::receiveSyncBatch(const QList<QSharedPointer<const DataSample> > &samples)
+{
+    for(const QSharedPointer<const DataSample> &sample : samples)
+    {
+        receiveSync(sample);
+    }
+}
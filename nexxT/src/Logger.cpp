@@ -13,6 +13,7 @@ namespace nexxT
 {
     unsigned int Logging::loglevel;
     SharedQObjectPtr Logging::loggingService;
+    QMetaMethod Logging::logMethod;
 
     void Logging::setLogLevel(unsigned int level)
     {
@@ -21,15 +22,27 @@ namespace nexxT
 
     void Logging::setLoggingService(const SharedQObjectPtr &service)
     {
+        if( service.isNull() )
+        {
+            logMethod = QMetaMethod();
+        } else
+        {
+            int idx = service->metaObject()->indexOfMethod(QMetaObject::normalizedSignature("log(int,QString,QString,int)"));
+            logMethod = (idx >= 0) ? service->metaObject()->method(idx) : QMetaMethod();
+        }
         loggingService = service;
     }
 
     void Logging::_log(unsigned int level, const QString &message, const QString &file, unsigned int line)
     { 
         SharedQObjectPtr logger = loggingService;
+        QMetaMethod method = logMethod;
         if( !logger.isNull() )
         {
-            bool res = QMetaObject::invokeMethod(logger.get(), "log", Qt::DirectConnection, Q_ARG(int, level), Q_ARG(const QString &, message), Q_ARG(const QString &, file), Q_ARG(int, line));
+            /* use the method resolved in setLoggingService instead of looking up the slot by name for every message */
+            bool res = method.isValid() ?
+                method.invoke(logger.get(), Qt::DirectConnection, Q_ARG(int, level), Q_ARG(const QString &, message), Q_ARG(const QString &, file), Q_ARG(int, line)) :
+                QMetaObject::invokeMethod(logger.get(), "log", Qt::DirectConnection, Q_ARG(int, level), Q_ARG(const QString &, message), Q_ARG(const QString &, file), Q_ARG(int, line));
             if(!res)
             {
                 fprintf(stderr, "WARNING: invokeMetod returned false!\n");
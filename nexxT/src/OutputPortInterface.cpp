@@ -15,14 +15,30 @@
 #include <atomic>
 
 #include <QtCore/QThread>
+#include <QtCore/QPointer>
 #include <map>
 #include <cstdio>
 
 using namespace nexxT;
 
+namespace nexxT
+{
+    struct OutputPortD
+    {
+        /* input ports in the same thread, these are called directly without the QT signal machinery */
+        QList<QPointer<InputPortInterface> > directTargets;
+    };
+};
+
 OutputPortInterface::OutputPortInterface(bool dynamic, const QString &name, BaseFilterEnvironment *env) :
-    Port(dynamic, name, env)
+    Port(dynamic, name, env),
+    d(new OutputPortD())
+{
+}
+
+OutputPortInterface::~OutputPortInterface()
 {
+    delete d;
 }
 
 void OutputPortInterface::transmit(const SharedDataSamplePtr &sample)
@@ -31,7 +47,37 @@ void OutputPortInterface::transmit(const SharedDataSamplePtr &sample)
     {
         throw std::runtime_error("OutputPort::transmit has been called from unexpected thread.");
     }
+    /* inter-thread connections first, so that the receiving threads don't wait for the synchronous receivers */
     emit transmitSample(sample);
+    /* iterate over a (shallow) copy, the list might be modified when a target is destroyed */
+    const QList<QPointer<InputPortInterface> > targets = d->directTargets;
+    for(const QPointer<InputPortInterface> &target : targets)
+    {
+        if( !target.isNull() )
+        {
+            target->receiveSync(sample);
+        }
+    }
+}
+
+void OutputPortInterface::transmitBatch(const QList<SharedDataSamplePtr> &samples)
+{
+    if( QThread::currentThread() != thread() )
+    {
+        throw std::runtime_error("OutputPort::transmitBatch has been called from unexpected thread.");
+    }
+    if( !samples.isEmpty() )
+    {
+        emit transmitSampleBatch(samples);
+        const QList<QPointer<InputPortInterface> > targets = d->directTargets;
+        for(const QPointer<InputPortInterface> &target : targets)
+        {
+            if( !target.isNull() )
+            {
+                target->receiveSyncBatch(samples);
+            }
+        }
+    }
 }
 
 SharedPortPtr OutputPortInterface::clone(BaseFilterEnvironment *env) const
@@ -41,10 +87,14 @@ SharedPortPtr OutputPortInterface::clone(BaseFilterEnvironment *env) const
 
 void OutputPortInterface::setupDirectConnection(const SharedPortPtr &op, const SharedPortPtr &ip)
 {
-    const OutputPortInterface *p0 = dynamic_cast<const OutputPortInterface *>(op.data());
-    const InputPortInterface *p1 = dynamic_cast<const InputPortInterface *>(ip.data());
-    QObject::connect(p0, SIGNAL(transmitSample(const QSharedPointer<const nexxT::DataSample>&)),
-                     p1, SLOT(receiveSync(const QSharedPointer<const nexxT::DataSample> &)));
+    OutputPortInterface *p0 = dynamic_cast<OutputPortInterface *>(op.data());
+    InputPortInterface *p1 = dynamic_cast<InputPortInterface *>(ip.data());
+    /* connections within the same thread bypass the signal/slot mechanism; the connection is removed when the
+       input port is destroyed */
+    p0->d->directTargets.append(QPointer<InputPortInterface>(p1));
+    QObject::connect(p1, &QObject::destroyed, p0, [p0]() {
+        p0->d->directTargets.removeIf([](const QPointer<InputPortInterface> &target) { return target.isNull(); });
+    });
 }
 
 QObject *OutputPortInterface::setupInterThreadConnection(const SharedPortPtr &op, const SharedPortPtr &ip, QThread &outputThread, int width)
@@ -54,8 +104,20 @@ QObject *OutputPortInterface::setupInterThreadConnection(const SharedPortPtr &op
     const InputPortInterface *p1 = dynamic_cast<const InputPortInterface *>(ip.data());
     QObject::connect(p0, SIGNAL(transmitSample(const QSharedPointer<const nexxT::DataSample>&)),
                      itc, SLOT(receiveSample(const QSharedPointer<const nexxT::DataSample>&)));
-    QObject::connect(itc, SIGNAL(transmitInterThread(const QSharedPointer<const nexxT::DataSample> &, QSemaphore *)),
-                     p1, SLOT(receiveAsync(const QSharedPointer<const nexxT::DataSample> &, QSemaphore *)));
+    /* the lambda is executed in the thread of the input port; the connection might have been deleted while the
+       wakeup event was still queued (e.g. during stop or deinit), in this case the event is ignored */
+    InputPortInterface *receiver = const_cast<InputPortInterface *>(p1);
+    QPointer<InterThreadConnection> itcPtr(itc);
+    QObject::connect(itc, &InterThreadConnection::samplesPending, receiver,
+                     [receiver, itcPtr](InterThreadConnection *) {
+                         if( itcPtr.isNull() )
+                         {
+                             return;
+                         }
+                         receiver->receiveAsyncBatch(itcPtr->takePendingSamples(), itcPtr->semaphore());
+                     }, Qt::QueuedConnection);
+    QObject::connect(p0, SIGNAL(transmitSampleBatch(const QList<QSharedPointer<const nexxT::DataSample> >&)),
+                     itc, SLOT(receiveSampleBatch(const QList<QSharedPointer<const nexxT::DataSample> >&)));
     return itc;
 }
 
@@ -16,6 +16,8 @@
 #include <atomic>
 
 #include <QtCore/QThread>
+#include <QtCore/QMutex>
+#include <QtCore/QMutexLocker>
 #include <map>
 #include <cstdio>
 
@@ -35,6 +37,9 @@ namespace nexxT
         int width;
         QSemaphore semaphore;
         std::atomic_bool stopped;
+        /* samples which have been acquired by the source thread but not yet taken by the receiving thread */
+        QMutex pendingMutex;
+        QList<QSharedPointer<const DataSample> > pending;
         InterThreadConnectionD(int width) : width(width), semaphore(width), stopped(true) {}
     };
 
@@ -109,12 +114,82 @@ void InterThreadConnection::receiveSample(const QSharedPointer<const DataSample>
         }
         if( (d->width == 0) || (d->semaphore.tryAcquire(1, 500)) )
         {
-            emit transmitInterThread(sample, (d->width > 0) ? (&d->semaphore) : 0 );
+            addPending(QList<QSharedPointer<const DataSample> >{sample});
             break;
         }
     }
 }
 
+void InterThreadConnection::addPending(const QList<QSharedPointer<const DataSample> > &samples)
+{
+    bool wakeup;
+    {
+        QMutexLocker locker(&d->pendingMutex);
+        wakeup = d->pending.isEmpty();
+        d->pending.append(samples);
+    }
+    /* the receiving thread is only notified when the queue transitions from empty to non-empty, it takes
+       all samples queued up to that point with a single event */
+    if( wakeup )
+    {
+        emit samplesPending(this);
+    }
+}
+
+QList<QSharedPointer<const DataSample> > InterThreadConnection::takePendingSamples()
+{
+    QMutexLocker locker(&d->pendingMutex);
+    QList<QSharedPointer<const DataSample> > res;
+    res.swap(d->pending);
+    return res;
+}
+
+QSemaphore *InterThreadConnection::semaphore()
+{
+    return (d->width > 0) ? (&d->semaphore) : 0;
+}
+
+void InterThreadConnection::receiveSampleBatch(const QList<QSharedPointer<const DataSample> > &samples)
+{
+    QSemaphore *semaphore = (d->width > 0) ? (&d->semaphore) : 0;
+    QList<QSharedPointer<const DataSample> > pending;
+    for(const QSharedPointer<const DataSample> &sample : samples)
+    {
+        while(true)
+        {
+            if( d->stopped.load() )
+            {
+                NEXXT_LOG_WARN("The inter-thread connection is set to stopped mode; data samples discarded.");
+                if( semaphore && !pending.isEmpty() )
+                {
+                    semaphore->release(pending.size());
+                }
+                return;
+            }
+            if( (!semaphore) || semaphore->tryAcquire(1) )
+            {
+                pending.append(sample);
+                break;
+            }
+            /* the receiver needs to release the semaphore, so forward the samples acquired so far */
+            if( !pending.isEmpty() )
+            {
+                addPending(pending);
+                pending.clear();
+            }
+            if( semaphore->tryAcquire(1, 500) )
+            {
+                pending.append(sample);
+                break;
+            }
+        }
+    }
+    if( !pending.isEmpty() )
+    {
+        addPending(pending);
+    }
+}
+
 void InterThreadConnection::setStopped(bool stopped)
 {
     d->stopped.store(stopped);
@@ -24,4 +24,10 @@ PropertyReceiver = FilterSurrogate(
     "binary://" + str((Path(__file__).parent /
                        "binary" / "${NEXXT_PLATFORM}" / "${NEXXT_VARIANT}" / "test_plugins").absolute()),
     "PropertyReceiver"
-)
\ No newline at end of file
+)
+
+CRawDataSampleCheck = FilterSurrogate(
+    "binary://" + str((Path(__file__).parent /
+                       "binary" / "${NEXXT_PLATFORM}" / "${NEXXT_VARIANT}" / "test_plugins").absolute()),
+    "RawDataSampleCheck"
+)
@@ -6,6 +6,7 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 import pytest
 import nexxT.Qt
@@ -95,6 +96,27 @@ def test_smoke():
     simple_setup(2)
     simple_setup(4)
 
+def test_loadCached(tmp_path):
+    cfgFile = tmp_path / "cached.json"
+    cfg = {"composite_filters": [], "applications": [{"name": "testApp", "nodes": [], "connections": []}]}
+    cfgFile.write_text(json.dumps(cfg), encoding="utf-8")
+    config = Configuration()
+    ConfigFileLoader.load(config, cfgFile)
+    assert config.getApplicationNames() == ["testApp"]
+    # the cached contents must not be affected by the configuration
+    config.renameApp("testApp", "renamedApp")
+    ConfigFileLoader.load(config, cfgFile)
+    assert config.getApplicationNames() == ["testApp"]
+    # modifications of the file are detected, even if neither size nor modification time change
+    stat = cfgFile.stat()
+    cfg["applications"][0]["name"] = "mainApp"
+    cfgFile.write_text(json.dumps(cfg), encoding="utf-8")
+    os.utime(cfgFile, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cfgFile.stat().st_size == stat.st_size
+    ConfigFileLoader.load(config, cfgFile)
+    assert config.getApplicationNames() == ["mainApp"]
+    config.close()
+
 if __name__ == "__main__":
     setup()
     test_smoke()
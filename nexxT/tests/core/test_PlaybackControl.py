@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (C) 2020 ifm electronic gmbh
+#
+# THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+#
+
+from nexxT.Qt.QtCore import QCoreApplication, QObject, Signal, Slot
+from nexxT.services.SrvPlaybackControl import PlaybackControlConsole
+
+def setup():
+    global app
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication()
+
+class PlaybackDevice(QObject):
+    playbackStarted = Signal()
+
+    def __init__(self, name, calls):
+        super().__init__()
+        self.name = name
+        self.calls = calls
+
+    @Slot()
+    def startPlayback(self):
+        self.calls.append(("startPlayback", self.name))
+
+    @Slot()
+    def pausePlayback(self):
+        self.calls.append(("pausePlayback", self.name))
+
+    @Slot(str)
+    def stepForward(self, stream):
+        self.calls.append(("stepForward", self.name, stream))
+
+class SeekingPlaybackDevice(PlaybackDevice):
+    @Slot('qint64')
+    def seekTime(self, timestampNS):
+        self.calls.append(("seekTime", self.name, timestampNS))
+
+def test_featureSet():
+    pbc = PlaybackControlConsole(None)
+    reported = []
+    pbc.supportedFeaturesChanged.connect(lambda featureset, nameFilters: reported.append((featureset, nameFilters)))
+    calls = []
+    dev1 = PlaybackDevice("dev1", calls)
+    dev2 = SeekingPlaybackDevice("dev2", calls)
+    dev3 = PlaybackDevice("dev3", calls)
+    basic = frozenset(["startPlayback", "pausePlayback", "stepForward", "playbackStarted"])
+
+    # registrations in the main thread are reported synchronously
+    pbc.setupConnections(dev1, ["*.avi", "*.h5"])
+    assert reported == [(basic, frozenset(["*.avi", "*.h5"]))]
+    assert all(isinstance(s, frozenset) for s in reported[-1])
+    pbc.setupConnections(dev2, ["*.h5"])
+    assert reported[1:] == [(basic | {"seekTime"}, frozenset(["*.avi", "*.h5"]))]
+
+    # overlapping features and name filters don't change the union
+    pbc.setupConnections(dev3, ["*.avi"])
+    pbc.removeConnections(dev3)
+    assert len(reported) == 2
+
+    # the features of dev2 are removed, the shared name filter remains
+    pbc.removeConnections(dev2)
+    assert reported[2:] == [(basic, frozenset(["*.avi", "*.h5"]))]
+    pbc.removeConnections(dev1)
+    assert reported[3:] == [(frozenset(), frozenset())]
+    QCoreApplication.processEvents()
+    assert len(reported) == 4
+
+def test_routing():
+    pbc = PlaybackControlConsole(None)
+    calls = []
+    dev1 = PlaybackDevice("dev1", calls)
+    dev2 = SeekingPlaybackDevice("dev2", calls)
+    pbc.setupConnections(dev1, ["*.avi"])
+    pbc.setupConnections(dev2, ["*.avi"])
+    # give control to both devices
+    for spec in pbc._registeredDevices.values(): # pylint: disable=protected-access
+        spec["proxy"].setSequence("/path/to/sequence.avi")
+        assert spec["proxy"].hasControl()
+
+    pbc.startPlayback()
+    pbc.stepForward("stream")
+    pbc.seekTime(1000)
+    assert calls == [("startPlayback", "dev1"), ("startPlayback", "dev2"),
+                     ("stepForward", "dev1", "stream"), ("stepForward", "dev2", "stream"),
+                     ("seekTime", "dev2", 1000)]
+
+    # unregistered devices don't receive any calls
+    calls.clear()
+    pbc.removeConnections(dev2)
+    pbc.startPlayback()
+    pbc.pausePlayback()
+    assert calls == [("startPlayback", "dev1"), ("pausePlayback", "dev1")]
+    pbc.removeConnections(dev1)
+    pbc.startPlayback()
+    assert calls == [("startPlayback", "dev1"), ("pausePlayback", "dev1")]
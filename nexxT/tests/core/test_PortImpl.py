@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (C) 2020 ifm electronic gmbh
+#
+# THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+#
+
+import gc
+import os
+import time
+import pytest
+import nexxT
+from nexxT.core.ActiveApplication import ActiveApplication
+from nexxT.core.Graph import FilterGraph
+from nexxT.core.PropertyCollectionImpl import PropertyCollectionImpl
+from nexxT.interface import DataSample
+from nexxT.Qt.QtCore import QCoreApplication, QThread, Qt
+
+def setup():
+    global app
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication()
+
+class DummySubConfig(object):
+    class DummyConfig:
+        def __init__(self):
+            self.pc = PropertyCollectionImpl("root", None)
+
+        def propertyCollection(self):
+            return self.pc
+
+    def __init__(self):
+        self.dummyConfig = DummySubConfig.DummyConfig()
+        self.pc = PropertyCollectionImpl("root", None)
+
+    def getConfiguration(self):
+        return self.dummyConfig
+
+    def getPropertyCollection(self):
+        return self.pc
+
+    def getName(self):
+        return "dummy_subconfig"
+
+def sample(i):
+    return DataSample(b"%d" % i, "text/utf8", i)
+
+def run_transmission(sinks, transmissions, timeout_s=10):
+    """
+    Connect a source in the main thread to the given sinks and transmit samples in the active state.
+
+    :param sinks: dict mapping the sink names to dict(thread=..., width=..., dynamicQueue=...)
+    :param transmissions: list of samples (transmitted with transmit) or lists of samples (transmitted with
+                          transmitBatch)
+    :return: a tuple of a dict mapping the sink names to the list of received sample contents and the source's
+             output port
+    """
+    library = "pyfile://" + os.path.dirname(__file__) + "/../interface/SimpleStaticFilter.py"
+    fg = FilterGraph(DummySubConfig())
+    source = fg.addNode(library, "SimpleSource")
+    # the source's timer shall not fire during the test
+    fg.getMockup(source).getPropertyCollectionImpl().setProperty("frequency", 0.001)
+    for name, spec in sinks.items():
+        fg.renameNode(fg.addNode(library, "SimpleStaticFilter"), name)
+        p = fg.getMockup(name).getPropertyCollectionImpl()
+        p.setProperty("log_rcv", False)
+        p.getChildCollection("_nexxT").setProperty("thread", spec.get("thread", "main"))
+        fg.addConnection(source, "outPort", name, "inPort")
+        fg.setConnectionProperties(source, "outPort", name, "inPort", dict(width=spec.get("width", 1)))
+    QCoreApplication.processEvents()
+
+    aa = ActiveApplication(fg)
+    try:
+        received = {}
+        for name, spec in sinks.items():
+            received[name] = []
+            f = aa._threads[aa._filters2threads["/" + name]]._filters["/" + name] # pylint: disable=protected-access
+            plugin = f.getPlugin()
+            plugin.afterReceive = lambda ds, r=received[name]: r.append(int(ds.getContent().data()))
+            if spec.get("dynamicQueue", False):
+                # must be called in the filter's thread
+                plugin.onInit = lambda plugin=plugin: plugin.inPort.setInterthreadDynamicQueue(True)
+        outPort = aa._threads["main"]._filters["/" + source].getPlugin().outPort # pylint: disable=protected-access
+        aa.init()
+        aa.open()
+        aa.start()
+        numSamples = 0
+        for t in transmissions:
+            if isinstance(t, list):
+                outPort.transmitBatch(t)
+                numSamples += len(t)
+            else:
+                outPort.transmit(t)
+                numSamples += 1
+        t0 = time.monotonic()
+        while (any(len(r) < numSamples for r in received.values()) and time.monotonic() - t0 < timeout_s):
+            QCoreApplication.processEvents()
+        aa.stop()
+        aa.close()
+        aa.deinit()
+    finally:
+        aa.cleanup()
+    return received, outPort
+
+def test_sameAndCrossThread():
+    received, outPort = run_transmission(dict(same=dict(), cross=dict(thread="thread-2")),
+                                         [sample(i) for i in range(20)])
+    assert received["same"] == list(range(20))
+    assert received["cross"] == list(range(20))
+    if not nexxT.useCImpl:
+        # the direct connection is removed together with the input port
+        gc.collect()
+        assert outPort._directTargets == [] # pylint: disable=protected-access
+
+def mixed_transmissions(n):
+    # single samples and batches of varying size, the contents are the sample indices
+    res = []
+    i = 0
+    while i < n:
+        size = i % 4
+        if size == 0:
+            res.append(sample(i))
+            i += 1
+        else:
+            res.append([sample(j) for j in range(i, min(n, i + size))])
+            i += size
+    return res
+
+@pytest.mark.parametrize("sink", [dict(),
+                                  dict(thread="thread-2"),
+                                  dict(thread="thread-2", dynamicQueue=True)],
+                         ids=["direct", "interthread", "dynamicQueue"])
+def test_transmitBatch(sink):
+    received, _ = run_transmission(dict(sink=sink), [[sample(i) for i in range(10)]])
+    assert received["sink"] == list(range(10))
+    received, _ = run_transmission(dict(sink=sink), mixed_transmissions(50))
+    assert received["sink"] == list(range(50))
+
+@pytest.mark.skipif(nexxT.useCImpl, reason="python only test")
+def test_stoppedBatch():
+    # pylint: disable=import-outside-toplevel
+    from nexxT.core.PortImpl import InterThreadConnection
+    itc = InterThreadConnection(QThread.currentThread(), 2)
+    # stopped connections discard the samples without acquiring the semaphore
+    itc.receiveSampleBatch([sample(i) for i in range(3)])
+    assert itc.takePendingSamples() == []
+    assert itc.semaphore.available() == 2
+
+    # the receiver takes the first sample and the connection is stopped while the second one is still pending
+    itc.setStopped(False)
+    assert itc.semaphore.tryAcquire(1)
+    taken = []
+    def receiver(c):
+        taken.extend(c.takePendingSamples())
+        c.semaphore.release(len(taken))
+        c.setStopped(True)
+    itc.samplesPending.connect(receiver, Qt.DirectConnection)
+    samples = [sample(i) for i in range(3)]
+    itc.receiveSampleBatch(samples)
+    assert taken == samples[:1]
+    assert itc.takePendingSamples() == []
+    itc.semaphore.release(1)
+    assert itc.semaphore.available() == 2
+
+if __name__ == "__main__":
+    setup()
+    test_sameAndCrossThread()
+    for s in [dict(), dict(thread="thread-2"), dict(thread="thread-2", dynamicQueue=True)]:
+        test_transmitBatch(s)
+    test_stoppedBatch()
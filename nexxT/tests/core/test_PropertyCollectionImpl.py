@@ -154,5 +154,14 @@ def test_smoke():
                                                                  ("childRemoved", "child12"),
                                                                  ("childRemoved", "child1")])
 
+def test_getRawProperty():
+    p = PropertyCollectionImpl("root", None)
+    p.defineProperty("i", 1, "an int prop")
+    assert p.getRawProperty("i") == (1, False)
+    p.setVarProperty("i", "$X")
+    assert p.getRawProperty("i") == ("$X", True)
+    expect_exception(p.getRawProperty, PropertyCollectionPropertyNotFound, "j")
+
 if __name__ == "__main__":
-    test_smoke()
\ No newline at end of file
+    test_smoke()
+    test_getRawProperty()
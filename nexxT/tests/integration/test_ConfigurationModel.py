@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (C) 2020 ifm electronic gmbh
+#
+# THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+#
+
+import json
+from pathlib import Path
+import pytest
+from nexxT.Qt.QtCore import QModelIndex
+from nexxT.Qt.QtWidgets import QApplication
+from nexxT.Qt.QtTest import QAbstractItemModelTester
+from nexxT.core.Configuration import Configuration
+from nexxT.core.ConfigFiles import ConfigFileLoader
+from nexxT.services.SrvConfiguration import MVCConfigurationBase
+
+TEST1 = Path(__file__).parent.parent / "core" / "test1.json"
+
+def nodeIndex(model, appName, nodeName):
+    apps = model.index(1, 0, QModelIndex())
+    for r in range(model.rowCount(apps)):
+        app = model.index(r, 0, apps)
+        if model.data(app, 0) == appName:
+            for n in range(model.rowCount(app)):
+                node = model.index(n, 0, app)
+                if model.data(node, 0) == nodeName:
+                    return node
+    raise RuntimeError(f"node {appName}/{nodeName} not found")
+
+def recordSignals(model):
+    signals = []
+    for name in ["rowsInserted", "rowsRemoved", "modelReset", "dataChanged"]:
+        getattr(model, name).connect(lambda *args, name=name: signals.append(name))
+    return signals
+
+@pytest.mark.gui
+def test_consistency(qtbot): # pylint: disable=unused-argument
+    config = Configuration()
+    service = MVCConfigurationBase(config)
+    model = service.model
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    try:
+        ConfigFileLoader.load(config, TEST1)
+        source = nodeIndex(model, "testApp", "source")
+        assert model.rowCount(source) == 2
+
+        # property changes are reported from the event loop, with one signal for the changed row
+        signals = recordSignals(model)
+        pc = config.applicationByName("testApp").getGraph().getMockup("source").getPropertyCollectionImpl()
+        pc.setProperty("frequency", pc.getProperty("frequency") + 1)
+        assert signals == []
+        QApplication.processEvents()
+        assert signals == ["dataChanged"]
+
+        # reloading and closing reset the model once without reporting single rows
+        signals.clear()
+        service._reload() # pylint: disable=protected-access
+        assert signals == ["modelReset"]
+        assert model.rowCount(nodeIndex(model, "testApp", "source")) == 2
+        signals.clear()
+        config.close(avoidSave=True)
+        assert signals == ["modelReset"]
+        assert model.rowCount(model.index(1, 0, QModelIndex())) == 0
+        QApplication.processEvents()
+    finally:
+        del tester
+        config.close(avoidSave=True)
+
+@pytest.mark.gui
+def test_lazyNodes(qtbot, tmp_path): # pylint: disable=unused-argument
+    (tmp_path / "noprops.py").write_text("""\
+from nexxT.interface import Filter
+
+class NoProperties(Filter):
+    def __init__(self, env):
+        super().__init__(False, False, env)
+""", encoding="utf-8")
+    nodes = [{"name": "source", "library": "pyfile://" + str((TEST1.parent.parent / "interface" /
+                                                                 "SimpleStaticFilter.py").absolute()),
+              "factoryFunction": "SimpleSource"},
+             {"name": "empty", "library": "pyfile://" + str((tmp_path / "noprops.py").absolute()),
+              "factoryFunction": "NoProperties"}]
+    cfgFile = tmp_path / "lazy.json"
+    cfgFile.write_text(json.dumps({"composite_filters": [],
+                                   "applications": [{"name": "app", "nodes": nodes, "connections": []}]}),
+                       encoding="utf-8")
+    config = Configuration()
+    service = MVCConfigurationBase(config)
+    model = service.model
+    try:
+        ConfigFileLoader.load(config, cfgFile)
+        graph = config.applicationByName("app").getGraph()
+
+        # the properties of a node are created when they are requested by a view
+        source = nodeIndex(model, "app", "source")
+        assert model.hasChildren(source)
+        assert source.internalPointer().children == []
+        assert model.rowCount(source) > 0
+        assert len(source.internalPointer().children) == model.rowCount(source)
+
+        # a node without properties has no children, its first property is reported as an insert
+        empty = nodeIndex(model, "app", "empty")
+        assert not model.hasChildren(empty)
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent, first, last)))
+        graph.getMockup("empty").getPropertyCollectionImpl().defineProperty("new_property", 1, "a new property")
+        assert inserted == [(empty, 0, 0)]
+        assert model.hasChildren(empty)
+        assert model.rowCount(empty) == 1
+    finally:
+        config.close(avoidSave=True)
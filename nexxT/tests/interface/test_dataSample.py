@@ -11,6 +11,8 @@ import time
 import pytest
 import nexxT
 from nexxT.interface import DataSample
+from nexxT.core.FilterEnvironment import FilterEnvironment
+from nexxT.core.PropertyCollectionImpl import PropertyCollectionImpl
 
 logging.getLogger(__name__).debug("executing test_dataSample.py")
 
@@ -50,6 +52,18 @@ def test_currentTime():
     print("shortestDelta: %s" % shortestDelta)
     assert shortestDelta <= 1e-5
 
+@pytest.mark.skipif(not nexxT.useCImpl, reason="c++ only test")
+def test_rawDataContent():
+    # the sample is created, copied and released in the c++ filter's onInit, the content is read afterwards
+    with FilterEnvironment("pymod://nexxT.tests", "CRawDataSampleCheck",
+                           PropertyCollectionImpl("root", None)) as env:
+        env.init()
+        pc = env.propertyCollection()
+        assert pc.getProperty("released")
+        assert pc.getProperty("content") == "raw data sample|raw data sample"
+        env.deinit()
+
 if __name__ == "__main__":
     test_basic()
-    test_currentTime()
\ No newline at end of file
+    test_currentTime()
+    test_rawDataContent()
\ No newline at end of file
@@ -10,6 +10,7 @@
 #include "SimpleSource.hpp"
 #include "TestExceptionFilter.hpp"
 #include "Properties.hpp"
+#include "RawDataSamples.hpp"
 
 NEXXT_PLUGIN_DEFINE_START()
 NEXXT_PLUGIN_ADD_FILTER(VideoPlaybackDevice)
@@ -17,4 +18,5 @@ NEXXT_PLUGIN_ADD_FILTER(CameraGrabber)
 NEXXT_PLUGIN_ADD_FILTER(SimpleSource)
 NEXXT_PLUGIN_ADD_FILTER(TestExceptionFilter)
 NEXXT_PLUGIN_ADD_FILTER(PropertyReceiver)
+NEXXT_PLUGIN_ADD_FILTER(RawDataSampleCheck)
 NEXXT_PLUGIN_DEFINE_FINISH()
@@ -0,0 +1,50 @@
+/* 
+ * SPDX-License-Identifier: Apache-2.0
+ * Copyright (C) 2020 ifm electronic gmbh
+ *
+ * THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+ */
+
+#include "RawDataSamples.hpp"
+#include "nexxT/PropertyCollection.hpp"
+#include "nexxT/DataSamples.hpp"
+#include <algorithm>
+#include <vector>
+
+using namespace nexxT;
+
+RawDataSampleCheck::RawDataSampleCheck(BaseFilterEnvironment *env) :
+    Filter(false, false, env)
+{
+    propertyCollection()->defineProperty("released", false, "whether the release callback has been called");
+    propertyCollection()->defineProperty("content", "", "the content read after the sample has been released");
+}
+
+RawDataSampleCheck::~RawDataSampleCheck()
+{
+}
+
+void RawDataSampleCheck::onInit()
+{
+    static const char text[] = "raw data sample";
+    std::vector<char> buffer(text, text + sizeof(text) - 1);
+    bool released = false;
+    QByteArray content;
+    QByteArray copiedContent;
+    {
+        SharedDataSamplePtr sample = DataSample::fromRawData(
+            buffer.data(), qsizetype(buffer.size()), "text/utf8", DataSample::currentTime(),
+            [&buffer, &released]() {
+                /* the external memory is overwritten when it is released */
+                std::fill(buffer.begin(), buffer.end(), 'x');
+                released = true;
+            });
+        content = sample->getContent();
+        SharedDataSamplePtr copied = DataSample::copy(sample);
+        sample.reset();
+        copiedContent = copied->getContent();
+    }
+    propertyCollection()->setProperty("released", released);
+    /* both the content and the copy must still contain the original text */
+    propertyCollection()->setProperty("content", QString::fromUtf8(content) + "|" + QString::fromUtf8(copiedContent));
+}
@@ -0,0 +1,27 @@
+/* 
+ * SPDX-License-Identifier: Apache-2.0
+ * Copyright (C) 2020 ifm electronic gmbh
+ *
+ * THE PROGRAM IS PROVIDED "AS IS" WITHOUT WARRANTY OF ANY KIND.
+ */
+
+#ifndef RAW_DATA_SAMPLES_HPP
+#define RAW_DATA_SAMPLES_HPP
+
+#include "nexxT/NexxTPlugins.hpp"
+
+/* creates a sample with DataSample::fromRawData during onInit and stores the results of the checks in the
+   properties "released" and "content" */
+class RawDataSampleCheck : public nexxT::Filter
+{
+    Q_OBJECT
+public:
+    RawDataSampleCheck(nexxT::BaseFilterEnvironment *env);
+    virtual ~RawDataSampleCheck();
+
+    virtual void onInit();
+
+    NEXXT_PLUGIN_DECLARE_FILTER(RawDataSampleCheck)
+};
+
+#endif
@@ -24,6 +24,7 @@ plugin = env.SharedLibrary("test_plugins", env.RegisterSources(Split("""
     VideoGrabber.cpp
     CameraGrabber.cpp
     Properties.cpp
+    RawDataSamples.cpp
 """)))
 env.RegisterTargets(plugin)
 